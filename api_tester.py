@@ -8,13 +8,190 @@ import os
 import sys
 import json
 import requests
-import threading
 import time
-from datetime import datetime
+import functools
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Concurrent sends allowed at once; also sizes the per-host connection pool
+MAX_WORKERS = 10
+
+# Choices for the method and authentication dropdowns
+HTTP_METHODS = ("GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS")
+AUTH_TYPES = ("None", "Basic Auth", "Bearer Token", "API Key")
+
+# Most recent history entries kept in memory and in the history log
+HISTORY_LIMIT = 1000
+
+# Response bodies longer than this are shown truncated until "Load Full"
+RESPONSE_PREVIEW_CHARS = 256 * 1024
+
+# Application stylesheet, parsed once by QApplication in main()
+_STYLESHEET = """
+QMainWindow {
+    background-color: #1e1e1e;
+}
+QWidget {
+    background-color: #2d2d2d;
+    color: #ffffff;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 1px solid #444;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding-top: 10px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QLineEdit, QPlainTextEdit, QComboBox, QTableView {
+    background-color: #3e3e3e;
+    border: 1px solid #555;
+    border-radius: 3px;
+    padding: 5px;
+}
+QHeaderView::section {
+    background-color: #3e3e3e;
+    padding: 5px;
+    border: 1px solid #555;
+}
+QTabWidget::pane {
+    border: 1px solid #444;
+}
+QTabBar::tab {
+    background-color: #3e3e3e;
+    color: #ccc;
+    padding: 8px 16px;
+}
+QTabBar::tab:selected {
+    background-color: #2d2d2d;
+    color: #fff;
+    border-bottom: 2px solid #0078d7;
+}
+QStatusBar {
+    background-color: #0078d7;
+    color: white;
+}
+"""
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj, pretty=False):
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode('utf-8')
+
+def _timestamp():
+    """Local ISO-8601 timestamp built from a single time.time() call"""
+    now = time.time()
+    return time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(now)) + f'.{int(now % 1 * 1e6):06d}'
+
+@functools.lru_cache(maxsize=512)
+def _is_valid_url(url):
+    """Check that a URL has an http(s) scheme and a host"""
+    parsed = urlparse(url)
+    return parsed.scheme in ('http', 'https') and bool(parsed.netloc)
+
+def _pretty_json(data):
+    """Pretty-print JSON bytes"""
+    return _json_dumps(_json_loads(data), pretty=True).decode('utf-8')
+
+def _looks_like_json(data):
+    """Check whether bytes start like a JSON object or array"""
+    for byte in data[:1024]:
+        if byte not in b' \t\r\n':
+            return byte in b'{['
+    return False
+
+class KVTableModel(QAbstractTableModel):
+    """Table model backed by a plain list of string rows"""
+    
+    def __init__(self, headers, editable=True, parent=None):
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._editable = editable
+        self._rows = []
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role in (Qt.DisplayRole, Qt.EditRole):
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def setData(self, index, value, role=Qt.EditRole):
+        if not index.isValid() or role != Qt.EditRole:
+            return False
+        self._rows[index.row()][index.column()] = str(value)
+        self.dataChanged.emit(index, index, [role])
+        return True
+    
+    def flags(self, index):
+        if not index.isValid():
+            return Qt.NoItemFlags
+        flags = Qt.ItemIsSelectable | Qt.ItemIsEnabled
+        if self._editable:
+            flags |= Qt.ItemIsEditable
+        return flags
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+    
+    def insertRows(self, row, count, parent=QModelIndex()):
+        self.beginInsertRows(parent, row, row + count - 1)
+        width = len(self._headers)
+        self._rows[row:row] = [[""] * width for _ in range(count)]
+        self.endInsertRows()
+        return True
+    
+    def removeRows(self, row, count, parent=QModelIndex()):
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        self.endRemoveRows()
+        return True
+    
+    def set_rows(self, rows):
+        """Replace all rows with a single model reset"""
+        self.beginResetModel()
+        self._rows = [[str(cell) for cell in row] for row in rows]
+        self.endResetModel()
+    
+    def to_dict(self):
+        """Return two-column rows as a dict, skipping rows with a blank key"""
+        pairs = ((key.strip(), value.strip()) for key, value in self._rows)
+        return {key: value for key, value in pairs if key}
+    
+    def append_row(self, row):
+        """Append one row to the end of the model"""
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.append([str(cell) for cell in row])
+        self.endInsertRows()
 
 class APITester(QMainWindow):
     """Main API Tester application"""
@@ -24,11 +201,12 @@ class APITester(QMainWindow):
         self.home_dir = os.path.expanduser("~")
         self.config_dir = os.path.join(self.home_dir, '.turboX')
         self.requests_file = os.path.join(self.config_dir, 'tools', 'api_requests.json')
-        self.history_file = os.path.join(self.config_dir, 'tools', 'api_history.json')
+        self.history_file = os.path.join(self.config_dir, 'tools', 'api_history.jsonl')
         
         # Load saved data
         self.saved_requests = self._load_json(self.requests_file, [])
-        self.history = self._load_json(self.history_file, [])
+        self.history = self._load_history()
+        self._history_fp = open(self.history_file, 'ab', buffering=0)
         
         # Current request state
         self.current_request = {
@@ -41,6 +219,23 @@ class APITester(QMainWindow):
             "auth": {}
         }
         
+        # Pooled HTTP connections and worker threads shared by all sends
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.executor = ThreadPoolExecutor(max_workers=MAX_WORKERS)
+        
+        # Coalesce status bar bursts into at most one repaint per frame
+        self._pending_status = ""
+        self._status_timer = QTimer(self)
+        self._status_timer.setSingleShot(True)
+        self._status_timer.setInterval(16)
+        self._status_timer.timeout.connect(self._flush_status)
+        
+        # Full text of the last response (the editor may only hold a preview)
+        self.response_text = ""
+        
         # Browser extension connection
         self.browser_data = []
         self.connected_to_browser = False
@@ -55,8 +250,8 @@ class APITester(QMainWindow):
         """Load JSON file or return default"""
         try:
             if os.path.exists(filepath):
-                with open(filepath, 'r') as f:
-                    return json.load(f)
+                with open(filepath, 'rb') as f:
+                    return _json_loads(f.read())
         except Exception as e:
             print(f"⚠️  Load error {filepath}: {e}")
         return default
@@ -65,18 +260,56 @@ class APITester(QMainWindow):
         """Save data to JSON file"""
         try:
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            with open(filepath, 'wb') as f:
+                f.write(_json_dumps(data, pretty=True))
             return True
         except Exception as e:
             print(f"❌ Save error {filepath}: {e}")
             return False
     
+    def _load_history(self):
+        """Load the newest history entries, migrating the old JSON file
+        and trimming the log once it holds twice the kept amount"""
+        os.makedirs(os.path.dirname(self.history_file), exist_ok=True)
+        legacy_file = os.path.join(self.config_dir, 'tools', 'api_history.json')
+        if os.path.exists(legacy_file) and not os.path.exists(self.history_file):
+            with open(self.history_file, 'wb') as f:
+                for entry in self._load_json(legacy_file, []):
+                    f.write(_json_dumps(entry) + b'\n')
+        
+        history = deque(maxlen=HISTORY_LIMIT)
+        total = 0
+        for entry in self._iter_history():
+            history.append(entry)
+            total += 1
+        
+        if total > 2 * HISTORY_LIMIT:
+            with open(self.history_file, 'wb') as f:
+                f.writelines(_json_dumps(entry) + b'\n' for entry in history)
+        return history
+    
+    def _iter_history(self):
+        """Yield history entries from the log one line at a time"""
+        try:
+            with open(self.history_file, 'rb') as f:
+                for line in f:
+                    if line.strip():
+                        yield _json_loads(line)
+        except Exception as e:
+            print(f"⚠️  Load error {self.history_file}: {e}")
+    
+    def _append_history(self, entry):
+        """Record one history entry without rewriting the log"""
+        self.history.append(entry)
+        try:
+            self._history_fp.write(_json_dumps(entry) + b'\n')
+        except Exception as e:
+            print(f"❌ Save error {self.history_file}: {e}")
+    
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("TurboX API Tester")
         self.setGeometry(100, 100, 1200, 700)
-        self.setStyleSheet(self._get_stylesheet())
         
         # Central widget
         central_widget = QWidget()
@@ -103,7 +336,7 @@ class APITester(QMainWindow):
         url_layout.addWidget(QLabel("Method:"))
         
         self.method_combo = QComboBox()
-        self.method_combo.addItems(["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"])
+        self.method_combo.addItems(HTTP_METHODS)
         self.method_combo.setFixedWidth(100)
         url_layout.addWidget(self.method_combo)
         
@@ -118,8 +351,9 @@ class APITester(QMainWindow):
         headers_label = QLabel("Headers:")
         config_layout.addWidget(headers_label)
         
-        self.headers_table = QTableWidget(0, 2)
-        self.headers_table.setHorizontalHeaderLabels(["Key", "Value"])
+        self.headers_model = KVTableModel(["Key", "Value"])
+        self.headers_table = QTableView()
+        self.headers_table.setModel(self.headers_model)
         self.headers_table.horizontalHeader().setStretchLastSection(True)
         config_layout.addWidget(self.headers_table)
         
@@ -139,8 +373,9 @@ class APITester(QMainWindow):
         params_label = QLabel("Query Parameters:")
         config_layout.addWidget(params_label)
         
-        self.params_table = QTableWidget(0, 2)
-        self.params_table.setHorizontalHeaderLabels(["Key", "Value"])
+        self.params_model = KVTableModel(["Key", "Value"])
+        self.params_table = QTableView()
+        self.params_table.setModel(self.params_model)
         self.params_table.horizontalHeader().setStretchLastSection(True)
         config_layout.addWidget(self.params_table)
         
@@ -171,8 +406,9 @@ class APITester(QMainWindow):
         form_widget = QWidget()
         form_layout = QVBoxLayout(form_widget)
         
-        self.form_table = QTableWidget(0, 2)
-        self.form_table.setHorizontalHeaderLabels(["Key", "Value"])
+        self.form_model = KVTableModel(["Key", "Value"])
+        self.form_table = QTableView()
+        self.form_table.setModel(self.form_model)
         self.form_table.horizontalHeader().setStretchLastSection(True)
         form_layout.addWidget(self.form_table)
         
@@ -202,53 +438,20 @@ class APITester(QMainWindow):
         auth_layout = QVBoxLayout()
         
         auth_type_combo = QComboBox()
-        auth_type_combo.addItems(["None", "Basic Auth", "Bearer Token", "API Key"])
+        auth_type_combo.addItems(AUTH_TYPES)
         auth_layout.addWidget(auth_type_combo)
         
-        # Auth fields (initially hidden)
-        self.auth_fields = QStackedWidget()
-        
-        # None
-        none_widget = QWidget()
-        self.auth_fields.addWidget(none_widget)
-        
-        # Basic Auth
-        basic_widget = QWidget()
-        basic_layout = QVBoxLayout(basic_widget)
-        basic_layout.addWidget(QLabel("Username:"))
-        self.basic_user = QLineEdit()
-        basic_layout.addWidget(self.basic_user)
-        basic_layout.addWidget(QLabel("Password:"))
-        self.basic_pass = QLineEdit()
-        self.basic_pass.setEchoMode(QLineEdit.Password)
-        basic_layout.addWidget(self.basic_pass)
-        self.auth_fields.addWidget(basic_widget)
-        
-        # Bearer Token
-        bearer_widget = QWidget()
-        bearer_layout = QVBoxLayout(bearer_widget)
-        bearer_layout.addWidget(QLabel("Token:"))
-        self.bearer_token = QLineEdit()
-        bearer_layout.addWidget(self.bearer_token)
-        self.auth_fields.addWidget(bearer_widget)
-        
-        # API Key
-        apikey_widget = QWidget()
-        apikey_layout = QVBoxLayout(apikey_widget)
-        apikey_layout.addWidget(QLabel("Key:"))
-        self.api_key = QLineEdit()
-        apikey_layout.addWidget(self.api_key)
-        apikey_layout.addWidget(QLabel("Value:"))
-        self.api_value = QLineEdit()
-        apikey_layout.addWidget(self.api_value)
-        apikey_layout.addWidget(QLabel("In:"))
-        self.api_location = QComboBox()
-        self.api_location.addItems(["Header", "Query"])
-        apikey_layout.addWidget(self.api_location)
-        self.auth_fields.addWidget(apikey_widget)
-        
+        # Auth fields are only built the first time their type is picked
+        self._auth_builders = {
+            1: self._build_basic_auth,
+            2: self._build_bearer_auth,
+            3: self._build_apikey_auth
+        }
+        self._auth_widgets = {0: QWidget()}
+        self.auth_layout = auth_layout
+        self.auth_fields = self._auth_widgets[0]
         auth_layout.addWidget(self.auth_fields)
-        auth_type_combo.currentIndexChanged.connect(self.auth_fields.setCurrentIndex)
+        auth_type_combo.currentIndexChanged.connect(self._show_auth_fields)
         
         auth_group.setLayout(auth_layout)
         left_layout.addWidget(auth_group)
@@ -305,8 +508,9 @@ class APITester(QMainWindow):
         response_tabs.addTab(self.headers_viewer, "Headers")
         
         # Browser captured data
-        self.browser_viewer = QTableWidget(0, 4)
-        self.browser_viewer.setHorizontalHeaderLabels(["Method", "URL", "Status", "Time"])
+        self.browser_model = KVTableModel(["Method", "URL", "Status", "Time"], editable=False)
+        self.browser_viewer = QTableView()
+        self.browser_viewer.setModel(self.browser_model)
         self.browser_viewer.horizontalHeader().setStretchLastSection(True)
         response_tabs.addTab(self.browser_viewer, "Browser Captures")
         
@@ -315,6 +519,11 @@ class APITester(QMainWindow):
         # Response action buttons
         action_buttons = QHBoxLayout()
         
+        self.load_full_btn = QPushButton("Load Full")
+        self.load_full_btn.setEnabled(False)
+        self.load_full_btn.clicked.connect(self.load_full_response)
+        action_buttons.addWidget(self.load_full_btn)
+        
         copy_btn = QPushButton("Copy Response")
         copy_btn.clicked.connect(self.copy_response)
         action_buttons.addWidget(copy_btn)
@@ -337,7 +546,7 @@ class APITester(QMainWindow):
         main_layout.addWidget(splitter, 1)
         
         # Status bar
-        self.statusBar().showMessage("Ready")
+        self.show_status("Ready")
         
         # Load first saved request if exists
         if self.saved_requests:
@@ -362,19 +571,9 @@ class APITester(QMainWindow):
         
         # Load request dropdown
         load_btn = QPushButton("📂 Load")
-        load_menu = QMenu()
-        
-        for i, req in enumerate(self.saved_requests):
-            action = QAction(req.get('name', f'Request {i+1}'), self)
-            action.triggered.connect(lambda checked, idx=i: self.load_request(idx))
-            load_menu.addAction(action)
-        
-        if not self.saved_requests:
-            no_action = QAction("No saved requests", self)
-            no_action.setEnabled(False)
-            load_menu.addAction(no_action)
-        
-        load_btn.setMenu(load_menu)
+        self.load_menu = QMenu()
+        self.load_menu.aboutToShow.connect(self._populate_load_menu)
+        load_btn.setMenu(self.load_menu)
         toolbar.addWidget(load_btn)
         
         toolbar.addSeparator()
@@ -409,130 +608,118 @@ class APITester(QMainWindow):
         
         return toolbar
     
-    def _get_stylesheet(self):
-        """Get application stylesheet"""
-        return """
-        QMainWindow {
-            background-color: #1e1e1e;
-        }
-        QWidget {
-            background-color: #2d2d2d;
-            color: #ffffff;
-            font-family: 'Segoe UI', Arial, sans-serif;
-        }
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #444;
-            border-radius: 5px;
-            margin-top: 10px;
-            padding-top: 10px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-        }
-        QLineEdit, QPlainTextEdit, QComboBox, QTableWidget {
-            background-color: #3e3e3e;
-            border: 1px solid #555;
-            border-radius: 3px;
-            padding: 5px;
-        }
-        QHeaderView::section {
-            background-color: #3e3e3e;
-            padding: 5px;
-            border: 1px solid #555;
-        }
-        QTabWidget::pane {
-            border: 1px solid #444;
-        }
-        QTabBar::tab {
-            background-color: #3e3e3e;
-            color: #ccc;
-            padding: 8px 16px;
-        }
-        QTabBar::tab:selected {
-            background-color: #2d2d2d;
-            color: #fff;
-            border-bottom: 2px solid #0078d7;
-        }
-        QStatusBar {
-            background-color: #0078d7;
-            color: white;
-        }
-        """
+    def _build_basic_auth(self):
+        """Create the Basic Auth fields"""
+        basic_widget = QWidget()
+        basic_layout = QVBoxLayout(basic_widget)
+        basic_layout.addWidget(QLabel("Username:"))
+        self.basic_user = QLineEdit()
+        basic_layout.addWidget(self.basic_user)
+        basic_layout.addWidget(QLabel("Password:"))
+        self.basic_pass = QLineEdit()
+        self.basic_pass.setEchoMode(QLineEdit.Password)
+        basic_layout.addWidget(self.basic_pass)
+        return basic_widget
+    
+    def _build_bearer_auth(self):
+        """Create the Bearer Token fields"""
+        bearer_widget = QWidget()
+        bearer_layout = QVBoxLayout(bearer_widget)
+        bearer_layout.addWidget(QLabel("Token:"))
+        self.bearer_token = QLineEdit()
+        bearer_layout.addWidget(self.bearer_token)
+        return bearer_widget
+    
+    def _build_apikey_auth(self):
+        """Create the API Key fields"""
+        apikey_widget = QWidget()
+        apikey_layout = QVBoxLayout(apikey_widget)
+        apikey_layout.addWidget(QLabel("Key:"))
+        self.api_key = QLineEdit()
+        apikey_layout.addWidget(self.api_key)
+        apikey_layout.addWidget(QLabel("Value:"))
+        self.api_value = QLineEdit()
+        apikey_layout.addWidget(self.api_value)
+        apikey_layout.addWidget(QLabel("In:"))
+        self.api_location = QComboBox()
+        self.api_location.addItems(["Header", "Query"])
+        apikey_layout.addWidget(self.api_location)
+        return apikey_widget
+    
+    def _show_auth_fields(self, index):
+        """Swap in the fields for the selected auth type, building them once"""
+        widget = self._auth_widgets.get(index)
+        if widget is None:
+            widget = self._auth_widgets[index] = self._auth_builders[index]()
+        if widget is not self.auth_fields:
+            self.auth_layout.replaceWidget(self.auth_fields, widget)
+            self.auth_fields.hide()
+            widget.show()
+            self.auth_fields = widget
+    
+    def show_status(self, message):
+        """Queue a status bar message; only the newest one is shown"""
+        self._pending_status = message
+        if not self._status_timer.isActive():
+            self._status_timer.start()
+    
+    def _flush_status(self):
+        """Show the most recently queued status bar message"""
+        self.statusBar().showMessage(self._pending_status)
+    
+    def _populate_load_menu(self):
+        """Fill the Load menu with saved requests when it is opened"""
+        self.load_menu.clear()
+        
+        for i, req in enumerate(self.saved_requests):
+            action = self.load_menu.addAction(req.get('name', f'Request {i+1}'))
+            action.triggered.connect(lambda checked, idx=i: self.load_request(idx))
+        
+        if not self.saved_requests:
+            no_action = self.load_menu.addAction("No saved requests")
+            no_action.setEnabled(False)
     
     def add_header_row(self):
         """Add a new row to headers table"""
-        row = self.headers_table.rowCount()
-        self.headers_table.insertRow(row)
+        self.headers_model.insertRows(self.headers_model.rowCount(), 1)
     
     def remove_header_row(self):
         """Remove selected rows from headers table"""
         selected = self.headers_table.selectionModel().selectedRows()
         for index in sorted(selected, key=lambda x: x.row(), reverse=True):
-            self.headers_table.removeRow(index.row())
+            self.headers_model.removeRows(index.row(), 1)
     
     def add_param_row(self):
         """Add a new row to parameters table"""
-        row = self.params_table.rowCount()
-        self.params_table.insertRow(row)
+        self.params_model.insertRows(self.params_model.rowCount(), 1)
     
     def remove_param_row(self):
         """Remove selected rows from parameters table"""
         selected = self.params_table.selectionModel().selectedRows()
         for index in sorted(selected, key=lambda x: x.row(), reverse=True):
-            self.params_table.removeRow(index.row())
+            self.params_model.removeRows(index.row(), 1)
     
     def add_form_row(self):
         """Add a new row to form data table"""
-        row = self.form_table.rowCount()
-        self.form_table.insertRow(row)
+        self.form_model.insertRows(self.form_model.rowCount(), 1)
     
     def remove_form_row(self):
         """Remove selected rows from form data table"""
         selected = self.form_table.selectionModel().selectedRows()
         for index in sorted(selected, key=lambda x: x.row(), reverse=True):
-            self.form_table.removeRow(index.row())
+            self.form_model.removeRows(index.row(), 1)
     
     def get_headers_from_table(self):
         """Extract headers from table"""
-        headers = {}
-        for row in range(self.headers_table.rowCount()):
-            key_item = self.headers_table.item(row, 0)
-            value_item = self.headers_table.item(row, 1)
-            
-            if key_item and key_item.text().strip():
-                key = key_item.text().strip()
-                value = value_item.text().strip() if value_item else ""
-                headers[key] = value
-        return headers
+        return self.headers_model.to_dict()
     
     def get_params_from_table(self):
         """Extract parameters from table"""
-        params = {}
-        for row in range(self.params_table.rowCount()):
-            key_item = self.params_table.item(row, 0)
-            value_item = self.params_table.item(row, 1)
-            
-            if key_item and key_item.text().strip():
-                key = key_item.text().strip()
-                value = value_item.text().strip() if value_item else ""
-                params[key] = value
-        return params
+        return self.params_model.to_dict()
     
     def get_form_from_table(self):
         """Extract form data from table"""
-        form_data = {}
-        for row in range(self.form_table.rowCount()):
-            key_item = self.form_table.item(row, 0)
-            value_item = self.form_table.item(row, 1)
-            
-            if key_item and key_item.text().strip():
-                key = key_item.text().strip()
-                value = value_item.text().strip() if value_item else ""
-                form_data[key] = value
-        return form_data
+        return self.form_model.to_dict()
     
     def send_request(self):
         """Send the API request"""
@@ -544,6 +731,10 @@ class APITester(QMainWindow):
             QMessageBox.warning(self, "Error", "Please enter a URL")
             return
         
+        if not _is_valid_url(url):
+            QMessageBox.warning(self, "Error", "Please enter a valid http(s) URL")
+            return
+        
         # Prepare request
         headers = self.get_headers_from_table()
         params = self.get_params_from_table()
@@ -551,17 +742,14 @@ class APITester(QMainWindow):
         # Get body based on active tab
         body = None
         content_type = None
+        validate_json = False
         
         current_tab = self.body_tabs.currentIndex()
-        if current_tab == 0:  # JSON
+        if current_tab == 0:  # JSON (validated on the worker, not the UI thread)
             body = self.json_editor.toPlainText()
             if body.strip():
-                try:
-                    json.loads(body)  # Validate JSON
-                    headers['Content-Type'] = 'application/json'
-                except json.JSONDecodeError:
-                    QMessageBox.warning(self, "Invalid JSON", "Please enter valid JSON")
-                    return
+                validate_json = True
+                headers['Content-Type'] = 'application/json'
         elif current_tab == 1:  # Form data
             form_data = self.get_form_from_table()
             if form_data:
@@ -573,20 +761,28 @@ class APITester(QMainWindow):
                 headers['Content-Type'] = 'text/plain'
         
         # Update UI
-        self.statusBar().showMessage("Sending request...")
+        self.show_status("Sending request...")
         start_time = time.time()
         
-        # Send request in thread
-        thread = threading.Thread(
-            target=self._send_request_thread,
-            args=(method, url, headers, params, body),
-            daemon=True
+        # Send request on the worker pool
+        self.executor.submit(
+            self._send_request_thread,
+            method, url, headers, params, body, start_time, validate_json
         )
-        thread.start()
     
-    def _send_request_thread(self, method, url, headers, params, body):
-        """Thread function to send request"""
+    def _send_request_thread(self, method, url, headers, params, body, start_time,
+                             validate_json=False):
+        """Worker function to send request"""
         try:
+            if validate_json:
+                try:
+                    _json_loads(body)
+                except ValueError as e:
+                    QMetaObject.invokeMethod(self, "_show_error",
+                                           Qt.QueuedConnection,
+                                           Q_ARG(str, f"Invalid JSON body: {e}"))
+                    return
+            
             # Convert request
             req_args = {
                 'method': method,
@@ -603,7 +799,7 @@ class APITester(QMainWindow):
                     req_args['data'] = body.encode('utf-8')
             
             # Send request
-            response = requests.request(**req_args)
+            response = self.session.request(**req_args)
             elapsed = time.time() - start_time
             
             # Update UI in main thread
@@ -624,58 +820,79 @@ class APITester(QMainWindow):
         self.time_label.setText(f"Time: {elapsed:.2f}s")
         self.size_label.setText(f"Size: {len(response.content)} bytes")
         
-        # Display response body
-        try:
-            # Try to format as JSON
-            json_data = response.json()
-            formatted = json.dumps(json_data, indent=2)
-            self.response_editor.setPlainText(formatted)
-        except:
-            # Display as text
-            self.response_editor.setPlainText(response.text)
+        # Display response body, pretty-printing it only if it sniffs as JSON
+        body = response.content
+        formatted = None
+        if _looks_like_json(body):
+            try:
+                formatted = _pretty_json(body)
+            except ValueError:
+                pass
+        if formatted is None:
+            try:
+                formatted = body.decode(response.encoding or 'utf-8', errors='replace')
+            except LookupError:
+                formatted = body.decode('utf-8', errors='replace')
+        self._show_response_body(formatted)
         
         # Display headers
-        headers_text = ""
-        for key, value in response.headers.items():
-            headers_text += f"{key}: {value}\n"
-        self.headers_viewer.setPlainText(headers_text)
+        self.headers_viewer.setPlainText(
+            "\n".join(f"{key}: {value}" for key, value in response.headers.items())
+        )
         
         # Add to history
         history_entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": _timestamp(),
             "method": response.request.method,
             "url": response.request.url,
             "status": response.status_code,
             "time": elapsed,
             "size": len(response.content)
         }
-        self.history.append(history_entry)
-        self._save_json(self.history_file, self.history)
+        self._append_history(history_entry)
         
-        self.statusBar().showMessage(f"Request completed in {elapsed:.2f}s")
+        self.show_status(f"Request completed in {elapsed:.2f}s")
+    
+    def _show_response_body(self, text):
+        """Display response body, previewing only the head of large payloads"""
+        self.response_text = text
+        if len(text) > RESPONSE_PREVIEW_CHARS:
+            self.response_editor.setPlainText(text[:RESPONSE_PREVIEW_CHARS])
+            self.response_editor.appendPlainText(
+                f"… [truncated, {len(text) / (1024 * 1024):.1f} MB available]"
+            )
+            self.load_full_btn.setEnabled(True)
+        else:
+            self.response_editor.setPlainText(text)
+            self.load_full_btn.setEnabled(False)
+    
+    def load_full_response(self):
+        """Replace the truncated preview with the full response body"""
+        self.response_editor.setPlainText(self.response_text)
+        self.load_full_btn.setEnabled(False)
     
     def _show_error(self, error_msg):
         """Show error message"""
-        self.response_editor.setPlainText(f"Error: {error_msg}")
+        self._show_response_body(f"Error: {error_msg}")
         self.status_label.setText("Status: Error")
-        self.statusBar().showMessage(f"Error: {error_msg}")
+        self.show_status(f"Error: {error_msg}")
     
     def new_request(self):
         """Create a new empty request"""
         self.url_input.clear()
-        self.headers_table.setRowCount(0)
-        self.params_table.setRowCount(0)
-        self.form_table.setRowCount(0)
+        self.headers_model.set_rows([])
+        self.params_model.set_rows([])
+        self.form_model.set_rows([])
         self.json_editor.clear()
         self.text_editor.clear()
-        self.response_editor.clear()
+        self._show_response_body("")
         self.headers_viewer.clear()
         
         self.status_label.setText("Status: Not sent")
         self.time_label.setText("Time: --")
         self.size_label.setText("Size: --")
         
-        self.statusBar().showMessage("New request created")
+        self.show_status("New request created")
     
     def save_request(self):
         """Save current request"""
@@ -690,13 +907,13 @@ class APITester(QMainWindow):
                 "body": self.json_editor.toPlainText(),
                 "form_data": self.get_form_from_table(),
                 "text_body": self.text_editor.toPlainText(),
-                "saved_at": datetime.now().isoformat()
+                "saved_at": _timestamp()
             }
             
             self.saved_requests.append(request_data)
             self._save_json(self.requests_file, self.saved_requests)
             
-            self.statusBar().showMessage(f"Request '{name}' saved")
+            self.show_status(f"Request '{name}' saved")
     
     def load_request(self, index):
         """Load a saved request"""
@@ -711,44 +928,29 @@ class APITester(QMainWindow):
                 self.method_combo.setCurrentIndex(method_index)
             
             # Load headers
-            self.headers_table.setRowCount(0)
             headers = req.get("headers", {})
-            for key, value in headers.items():
-                row = self.headers_table.rowCount()
-                self.headers_table.insertRow(row)
-                self.headers_table.setItem(row, 0, QTableWidgetItem(key))
-                self.headers_table.setItem(row, 1, QTableWidgetItem(str(value)))
+            self.headers_model.set_rows(headers.items())
             
             # Load params
-            self.params_table.setRowCount(0)
             params = req.get("params", {})
-            for key, value in params.items():
-                row = self.params_table.rowCount()
-                self.params_table.insertRow(row)
-                self.params_table.setItem(row, 0, QTableWidgetItem(key))
-                self.params_table.setItem(row, 1, QTableWidgetItem(str(value)))
+            self.params_model.set_rows(params.items())
             
             # Load body
             self.json_editor.setPlainText(req.get("body", ""))
             
             # Load form data
-            self.form_table.setRowCount(0)
             form_data = req.get("form_data", {})
-            for key, value in form_data.items():
-                row = self.form_table.rowCount()
-                self.form_table.insertRow(row)
-                self.form_table.setItem(row, 0, QTableWidgetItem(key))
-                self.form_table.setItem(row, 1, QTableWidgetItem(str(value)))
+            self.form_model.set_rows(form_data.items())
             
             self.text_editor.setPlainText(req.get("text_body", ""))
             
-            self.statusBar().showMessage(f"Loaded: {req.get('name', 'Unknown')}")
+            self.show_status(f"Loaded: {req.get('name', 'Unknown')}")
     
     def copy_response(self):
         """Copy response to clipboard"""
         clipboard = QApplication.clipboard()
-        clipboard.setText(self.response_editor.toPlainText())
-        self.statusBar().showMessage("Response copied to clipboard")
+        clipboard.setText(self.response_text)
+        self.show_status("Response copied to clipboard")
     
     def export_data(self):
         """Export request/response data"""
@@ -760,46 +962,60 @@ class APITester(QMainWindow):
         )
         
         if file_path:
-            export_data = {
-                "request": {
-                    "url": self.url_input.text(),
-                    "method": self.method_combo.currentText(),
-                    "headers": self.get_headers_from_table(),
-                    "params": self.get_params_from_table()
-                },
-                "response": {
-                    "body": self.response_editor.toPlainText(),
-                    "headers": self.headers_viewer.toPlainText(),
-                    "timestamp": datetime.now().isoformat()
-                }
+            request_data = {
+                "url": self.url_input.text(),
+                "method": self.method_combo.currentText(),
+                "headers": self.get_headers_from_table(),
+                "params": self.get_params_from_table()
+            }
+            response_data = {
+                "body": self.response_text,
+                "headers": self.headers_viewer.toPlainText(),
+                "timestamp": _timestamp()
             }
             
             try:
                 if file_path.endswith('.json'):
-                    with open(file_path, 'w') as f:
-                        json.dump(export_data, f, indent=2)
+                    with open(file_path, 'wb') as f:
+                        self._write_json_export(f, request_data, response_data)
                 elif file_path.endswith('.csv'):
                     # Simple CSV export
                     import csv
                     with open(file_path, 'w', newline='') as f:
                         writer = csv.writer(f)
                         writer.writerow(['Type', 'Key', 'Value'])
-                        for key, value in export_data['request']['headers'].items():
-                            writer.writerow(['Header', key, value])
-                        for key, value in export_data['request']['params'].items():
-                            writer.writerow(['Param', key, value])
+                        writer.writerows(
+                            ['Header', key, value]
+                            for key, value in request_data['headers'].items()
+                        )
+                        writer.writerows(
+                            ['Param', key, value]
+                            for key, value in request_data['params'].items()
+                        )
                 else:
                     with open(file_path, 'w') as f:
-                        f.write(str(export_data))
+                        f.write(str({"request": request_data, "response": response_data}))
                 
-                self.statusBar().showMessage(f"Data exported to {file_path}")
+                self.show_status(f"Data exported to {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Export Error", str(e))
     
+    def _write_json_export(self, f, request_data, response_data):
+        """Write the export document in pieces so the body is serialized on its own"""
+        f.write(b'{\n  "request": ')
+        f.write(_json_dumps(request_data))
+        f.write(b',\n  "response": {')
+        for i, (key, value) in enumerate(response_data.items()):
+            if i:
+                f.write(b',')
+            f.write(b'\n    ' + _json_dumps(key) + b': ')
+            f.write(_json_dumps(value))
+        f.write(b'\n  }\n}\n')
+    
     def connect_to_browser(self):
         """Attempt to connect to browser extension"""
         # This will be implemented in Phase 3 with socket connection
-        self.statusBar().showMessage("Browser connection: Not implemented in Phase 2")
+        self.show_status("Browser connection: Not implemented in Phase 2")
     
     def show_browser_data(self):
         """Show data captured from browser"""
@@ -811,10 +1027,17 @@ class APITester(QMainWindow):
         """Toggle SMS panel integration"""
         if enabled:
             self.sms_toggle.setText("📱 SMS Panel: ON")
-            self.statusBar().showMessage("SMS Panel enabled (Phase 3)")
+            self.show_status("SMS Panel enabled (Phase 3)")
         else:
             self.sms_toggle.setText("📱 SMS Panel: OFF")
-            self.statusBar().showMessage("SMS Panel disabled")
+            self.show_status("SMS Panel disabled")
+    
+    def closeEvent(self, event):
+        """Handle window close"""
+        self.executor.shutdown(wait=False)
+        self.session.close()
+        self._history_fp.close()
+        event.accept()
 
 def main():
     """Entry point"""
@@ -824,6 +1047,7 @@ def main():
         sys.exit(1)
     
     app = QApplication(sys.argv)
+    app.setStyleSheet(_STYLESHEET)
     tester = APITester()
     tester.show()
     
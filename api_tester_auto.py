@@ -7,18 +7,222 @@
 import os
 import sys
 import json
+import importlib.util
 import requests
 import threading
 import time
+from collections import deque
+from contextlib import contextmanager
 from datetime import datetime
-from urllib.parse import urlparse, parse_qs
+from multiprocessing.managers import BaseManager, BaseProxy
+from pathlib import Path
+from urllib.parse import urlparse, urljoin, parse_qs
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Response text beyond this many characters is not rendered in the editor
+RESPONSE_PREVIEW_CHARS = 256 * 1024
+
+# Fetched bodies are read in chunks and cut off beyond this size
+MAX_RESPONSE_BYTES = 16 * 1024 * 1024
+
+# Default number of captured requests kept in the Captured tab
+CAPTURE_LIMIT = 500
+
+# Seconds a resolved session (cookies/headers) is reused before re-reading it
+SESSION_CACHE_TTL = 30
+
+# Log lines kept in the log view, and queued before it is first opened
+LOG_MAX_LINES = 5000
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj, pretty=False):
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode('utf-8')
+
+@contextmanager
+def _batch_updates(table):
+    """Suspend repaints, signals and sorting while a table is bulk-edited"""
+    sorting = table.isSortingEnabled()
+    table.setUpdatesEnabled(False)
+    table.blockSignals(True)
+    table.setSortingEnabled(False)
+    try:
+        yield table
+    finally:
+        table.setSortingEnabled(sorting)
+        table.blockSignals(False)
+        table.setUpdatesEnabled(True)
+        table.viewport().update()
+
+def _use_fixed_row_height(table):
+    """Give every row the same height so Qt skips per-row size hints"""
+    header = table.verticalHeader()
+    header.setSectionResizeMode(QHeaderView.Fixed)
+    header.setDefaultSectionSize(22)
+
+class CapturedTableModel(QAbstractTableModel):
+    """Read-only table model over the list of captured request rows"""
+    
+    HEADERS = ("Method", "URL", "Status", "Time", "Size")
+    
+    def __init__(self, rows, limit, parent=None):
+        super().__init__(parent)
+        self._rows = rows
+        self._limit = limit
+    
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+    
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+    
+    def data(self, index, role=Qt.DisplayRole):
+        if index.isValid() and role == Qt.DisplayRole:
+            return self._rows[index.row()][index.column()]
+        return None
+    
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return super().headerData(section, orientation, role)
+    
+    def _trim(self, keep):
+        """Drop the oldest rows so that at most `keep` remain"""
+        excess = len(self._rows) - keep
+        if excess > 0:
+            self.beginRemoveRows(QModelIndex(), 0, excess - 1)
+            del self._rows[:excess]
+            self.endRemoveRows()
+    
+    def set_limit(self, limit):
+        """Change the maximum number of rows kept"""
+        self._limit = limit
+        self._trim(limit)
+    
+    def append_row(self, row):
+        """Append one captured request row, evicting the oldest at the limit"""
+        self._trim(self._limit - 1)
+        position = len(self._rows)
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._rows.append(row)
+        self.endInsertRows()
+    
+    def clear(self):
+        """Remove all rows with a single reset"""
+        self.beginResetModel()
+        self._rows.clear()
+        self.endResetModel()
+
+class SessionClient(BaseManager):
+    """Connects to the SessionManager shared by the automation controller"""
+
+SessionClient.register('get_session_manager')
+
+class WorkerSignals(QObject):
+    """Signals emitted by a pooled background worker"""
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(str)
+
+class Worker(QRunnable):
+    """Run a function on the thread pool and report back through signals"""
+    
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = WorkerSignals()
+    
+    @pyqtSlot()
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(str(e))
+        else:
+            self.signals.finished.emit(result)
 
 class AutomatedAPITester(QMainWindow):
     """Fully automated API tester with auto-login and CAPTCHA solving"""
     
+    # Helper classes loaded from ~/.turboX/scripts, shared by all windows
+    _script_classes = {}
+    
+    # Emitted per logged line; queued onto the GUI thread from workers
+    _log_queued = pyqtSignal()
+    
+    # Application stylesheet, parsed once by QApplication in main()
+    _STYLESHEET = """
+    QMainWindow {
+        background-color: #1e1e1e;
+    }
+    QWidget {
+        background-color: #2d2d2d;
+        color: #ffffff;
+        font-family: 'Segoe UI', Arial, sans-serif;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 1px solid #444;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QLineEdit, QPlainTextEdit, QComboBox, QTableView {
+        background-color: #3e3e3e;
+        border: 1px solid #555;
+        border-radius: 3px;
+        padding: 5px;
+    }
+    QTabWidget::pane {
+        border: 1px solid #444;
+    }
+    QTabBar::tab {
+        background-color: #3e3e3e;
+        color: #ccc;
+        padding: 8px 16px;
+    }
+    QTabBar::tab:selected {
+        background-color: #2d2d2d;
+        color: #fff;
+        border-bottom: 2px solid #0078d7;
+    }
+    QStatusBar {
+        background-color: #0078d7;
+        color: white;
+    }
+    QPushButton {
+        background-color: #4e4e4e;
+        color: white;
+        border: 1px solid #555;
+        border-radius: 3px;
+        padding: 8px 15px;
+    }
+    QPushButton:hover {
+        background-color: #5e5e5e;
+    }
+    """
+    
     def __init__(self, automation_mode=True):
         super().__init__()
         self.home_dir = os.path.expanduser("~")
@@ -33,10 +237,27 @@ class AutomatedAPITester(QMainWindow):
         self.is_automating = False
         self.current_session = None
         self.credentials = None
+        self._base_domain = ""
         
         # Captured requests
         self.captured_requests = []
         
+        # Last response body, kept whole since the editor may hold a preview
+        self._last_response_bytes = None
+        self._last_response_text = ""
+        self._last_response_is_json = False
+        
+        # Resolved sessions by id: (monotonic time fetched, session dict)
+        self._session_cache = {}
+        
+        # Shared worker pool for login and fetch jobs
+        self.thread_pool = QThreadPool.globalInstance()
+        self.thread_pool.setMaxThreadCount(8)
+        
+        # Keep-alive HTTP sessions, one per target domain
+        self._sessions = {}
+        self._sessions_lock = threading.Lock()
+        
         # Initialize UI
         self.init_ui()
         
@@ -47,31 +268,101 @@ class AutomatedAPITester(QMainWindow):
         if automation_mode:
             print("🤖 Automation mode: ON (Tools auto-launch, auto-fetch)")
     
+    def _load_script_class(self, module_name, class_name):
+        """Import a class from ~/.turboX/scripts without touching sys.path"""
+        key = (module_name, class_name)
+        cls = self._script_classes.get(key)
+        if cls is None:
+            path = os.path.join(self.config_dir, 'scripts', f'{module_name}.py')
+            spec = importlib.util.spec_from_file_location(module_name, path)
+            if spec is None:
+                raise ImportError(f"cannot load {path}")
+            module = sys.modules.get(module_name)
+            if module is None or getattr(module, '__file__', None) != path:
+                module = importlib.util.module_from_spec(spec)
+                spec.loader.exec_module(module)
+                sys.modules[module_name] = module
+            cls = getattr(module, class_name)
+            self._script_classes[key] = cls
+        return cls
+    
     def load_session_manager(self):
         """Load session manager module"""
+        shared = self._connect_shared_session_manager()
+        if shared is not None:
+            return shared
+        
+        # Broken user scripts must degrade to None, not take the window down
         try:
-            sys.path.append(os.path.join(self.config_dir, 'scripts'))
-            from session_manager import SessionManager
+            SessionManager = self._load_script_class('session_manager', 'SessionManager')
             return SessionManager()
-        except:
-            print("⚠️ Session manager not available")
+        except Exception as e:
+            print(f"⚠️ Session manager not available: {e}")
+            return None
+    
+    def _connect_shared_session_manager(self):
+        """Use the controller's SessionManager when launched by it"""
+        address = os.environ.get('TURBOX_SESSION_SERVER')
+        authkey = os.environ.get('TURBOX_SESSION_AUTHKEY')
+        if not address or not authkey:
+            return None
+        
+        try:
+            host, port = address.rsplit(':', 1)
+            manager = SessionClient(address=(host, int(port)), authkey=bytes.fromhex(authkey))
+            manager.connect()
+            return manager.get_session_manager()
+        except Exception as e:
+            print(f"⚠️ Shared session manager not reachable: {e}")
             return None
     
     def load_captcha_solver(self):
         """Load CAPTCHA solver module"""
+        # Broken user scripts must degrade to None, not take the window down
         try:
-            sys.path.append(os.path.join(self.config_dir, 'scripts'))
-            from captcha_solver import CaptchaSolver
+            CaptchaSolver = self._load_script_class('captcha_solver', 'CaptchaSolver')
             return CaptchaSolver()
-        except:
-            print("⚠️ CAPTCHA solver not available")
+        except Exception as e:
+            print(f"⚠️ CAPTCHA solver not available: {e}")
             return None
     
+    def _get_http_session(self, domain):
+        """Get the pooled HTTP session for a domain, creating it on first use"""
+        with self._sessions_lock:
+            session = self._sessions.get(domain)
+            if session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(
+                    pool_connections=10,
+                    pool_maxsize=20,
+                    max_retries=Retry(total=2, backoff_factor=0.2,
+                                      status_forcelist=[502, 503, 504])
+                )
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self._sessions[domain] = session
+            return session
+    
+    def _get_session_cached(self, session_id):
+        """Get a session with a precomputed 'cookie_header', reusing
+        the copy resolved within the last SESSION_CACHE_TTL seconds"""
+        now = time.monotonic()
+        cached = self._session_cache.get(session_id)
+        if cached and now - cached[0] < SESSION_CACHE_TTL:
+            return cached[1]
+        
+        session = self.session_mgr.get_session(session_id)
+        if session:
+            session = dict(session)
+            cookies = session.get('cookies') or {}
+            session['cookie_header'] = '; '.join(f"{k}={v}" for k, v in cookies.items())
+            self._session_cache[session_id] = (now, session)
+        return session
+    
     def init_ui(self):
         """Initialize API tester UI"""
         self.setWindowTitle("TurboX API Tester 🤖")
         self.setGeometry(100, 100, 1200, 700)
-        self.setStyleSheet(self.get_stylesheet())
         
         # Central widget
         central_widget = QWidget()
@@ -223,6 +514,7 @@ class AutomatedAPITester(QMainWindow):
         self.headers_table = QTableWidget(0, 2)
         self.headers_table.setHorizontalHeaderLabels(["Key", "Value"])
         self.headers_table.horizontalHeader().setStretchLastSection(True)
+        _use_fixed_row_height(self.headers_table)
         req_layout.addWidget(self.headers_table)
         
         # Headers buttons
@@ -246,6 +538,7 @@ class AutomatedAPITester(QMainWindow):
         self.params_table = QTableWidget(0, 2)
         self.params_table.setHorizontalHeaderLabels(["Key", "Value"])
         self.params_table.horizontalHeader().setStretchLastSection(True)
+        _use_fixed_row_height(self.params_table)
         params_layout.addWidget(self.params_table)
         
         param_buttons = QHBoxLayout()
@@ -273,6 +566,7 @@ class AutomatedAPITester(QMainWindow):
         self.form_table = QTableWidget(0, 2)
         self.form_table.setHorizontalHeaderLabels(["Key", "Value"])
         self.form_table.horizontalHeader().setStretchLastSection(True)
+        _use_fixed_row_height(self.form_table)
         form_layout.addWidget(self.form_table)
         
         form_buttons = QHBoxLayout()
@@ -339,43 +633,40 @@ class AutomatedAPITester(QMainWindow):
         # Response editor
         self.response_editor = QPlainTextEdit()
         self.response_editor.setReadOnly(True)
+        self.response_editor.setUndoRedoEnabled(False)
+        self.response_editor.setCenterOnScroll(False)
         response_layout.addWidget(self.response_editor, 1)
         
         self.results_tabs.addTab(response_tab, "Response")
         
-        # Headers tab
-        headers_tab = QWidget()
-        headers_layout = QVBoxLayout(headers_tab)
-        
-        self.headers_editor = QPlainTextEdit()
-        self.headers_editor.setReadOnly(True)
-        headers_layout.addWidget(self.headers_editor)
-        
-        self.results_tabs.addTab(headers_tab, "Headers")
-        
-        # Captured Requests tab
-        captured_tab = QWidget()
-        captured_layout = QVBoxLayout(captured_tab)
-        
-        self.captured_table = QTableWidget(0, 5)
-        self.captured_table.setHorizontalHeaderLabels(
-            ["Method", "URL", "Status", "Time", "Size"]
-        )
-        self.captured_table.horizontalHeader().setStretchLastSection(True)
-        self.captured_table.doubleClicked.connect(self.load_captured_request)
-        captured_layout.addWidget(self.captured_table)
-        
-        self.results_tabs.addTab(captured_tab, "Captured")
-        
-        # Automation Log tab
-        log_tab = QWidget()
-        log_layout = QVBoxLayout(log_tab)
-        
-        self.log_editor = QPlainTextEdit()
-        self.log_editor.setReadOnly(True)
-        log_layout.addWidget(self.log_editor)
-        
-        self.results_tabs.addTab(log_tab, "Automation Log")
+        # Headers, Captured and Log tabs start as empty pages and are
+        # filled in by their builder the first time they are selected
+        self.captured_model = CapturedTableModel(self.captured_requests, CAPTURE_LIMIT)
+        self.headers_editor = None
+        self.captured_table = None
+        self.log_editor = None
+        self._headers_text = ""
+        
+        # Log lines are queued (from any thread) and flushed in batches by
+        # a one-shot timer that only runs once the log view exists
+        self._log_queue = deque(maxlen=LOG_MAX_LINES)
+        self._log_dropped = 0
+        self._log_timestamp = (0, "")
+        self._log_timer = QTimer(self)
+        self._log_timer.setSingleShot(True)
+        self._log_timer.setInterval(100)
+        self._log_timer.timeout.connect(self._flush_logs)
+        self._log_queued.connect(self._schedule_log_flush)
+        
+        self._tab_builders = {}
+        for builder, label in ((self._build_headers_tab, "Headers"),
+                               (self._build_captured_tab, "Captured"),
+                               (self._build_log_tab, "Automation Log")):
+            page = QWidget()
+            QVBoxLayout(page)
+            index = self.results_tabs.addTab(page, label)
+            self._tab_builders[index] = builder
+        self.results_tabs.currentChanged.connect(self._ensure_tab_built)
         
         layout.addWidget(self.results_tabs, 1)
         
@@ -398,63 +689,50 @@ class AutomatedAPITester(QMainWindow):
         
         return panel
     
-    def get_stylesheet(self):
-        """Get application stylesheet"""
-        return """
-        QMainWindow {
-            background-color: #1e1e1e;
-        }
-        QWidget {
-            background-color: #2d2d2d;
-            color: #ffffff;
-            font-family: 'Segoe UI', Arial, sans-serif;
-        }
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #444;
-            border-radius: 5px;
-            margin-top: 10px;
-            padding-top: 10px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-        }
-        QLineEdit, QPlainTextEdit, QComboBox, QTableWidget {
-            background-color: #3e3e3e;
-            border: 1px solid #555;
-            border-radius: 3px;
-            padding: 5px;
-        }
-        QTabWidget::pane {
-            border: 1px solid #444;
-        }
-        QTabBar::tab {
-            background-color: #3e3e3e;
-            color: #ccc;
-            padding: 8px 16px;
-        }
-        QTabBar::tab:selected {
-            background-color: #2d2d2d;
-            color: #fff;
-            border-bottom: 2px solid #0078d7;
-        }
-        QStatusBar {
-            background-color: #0078d7;
-            color: white;
-        }
-        QPushButton {
-            background-color: #4e4e4e;
-            color: white;
-            border: 1px solid #555;
-            border-radius: 3px;
-            padding: 8px 15px;
-        }
-        QPushButton:hover {
-            background-color: #5e5e5e;
-        }
-        """
+    def _ensure_tab_built(self, index):
+        """Build a results tab's contents on its first selection"""
+        builder = self._tab_builders.pop(index, None)
+        if builder:
+            builder(self.results_tabs.widget(index).layout())
+    
+    def _build_headers_tab(self, layout):
+        """Create the response headers viewer"""
+        self.headers_editor = QPlainTextEdit()
+        self.headers_editor.setReadOnly(True)
+        self.headers_editor.setUndoRedoEnabled(False)
+        self.headers_editor.setCenterOnScroll(False)
+        self.headers_editor.setPlainText(self._headers_text)
+        layout.addWidget(self.headers_editor)
+    
+    def _build_captured_tab(self, layout):
+        """Create the captured requests table"""
+        limit_layout = QHBoxLayout()
+        limit_layout.addWidget(QLabel("Keep last:"))
+        capture_limit = QSpinBox()
+        capture_limit.setRange(50, 10000)
+        capture_limit.setSingleStep(50)
+        capture_limit.setValue(CAPTURE_LIMIT)
+        capture_limit.valueChanged.connect(self.captured_model.set_limit)
+        limit_layout.addWidget(capture_limit)
+        limit_layout.addStretch()
+        layout.addLayout(limit_layout)
+        
+        self.captured_table = QTableView()
+        self.captured_table.setModel(self.captured_model)
+        self.captured_table.horizontalHeader().setStretchLastSection(True)
+        self.captured_table.setShowGrid(False)
+        _use_fixed_row_height(self.captured_table)
+        self.captured_table.doubleClicked.connect(self.load_captured_request)
+        layout.addWidget(self.captured_table)
+    
+    def _build_log_tab(self, layout):
+        """Create the automation log viewer with messages logged so far"""
+        self.log_editor = QPlainTextEdit()
+        self.log_editor.setReadOnly(True)
+        self.log_editor.setUndoRedoEnabled(False)
+        self.log_editor.setMaximumBlockCount(LOG_MAX_LINES)
+        layout.addWidget(self.log_editor)
+        self._flush_logs()
     
     def toggle_automation(self, enabled):
         """Toggle automation mode"""
@@ -465,8 +743,36 @@ class AutomatedAPITester(QMainWindow):
     
     def log_message(self, message):
         """Add message to automation log"""
-        timestamp = datetime.now().strftime("%H:%M:%S")
-        self.log_editor.appendPlainText(f"[{timestamp}] {message}")
+        # Format the clock at most once per second
+        now = int(time.time())
+        second, timestamp = self._log_timestamp
+        if now != second:
+            timestamp = time.strftime("%H:%M:%S", time.localtime(now))
+            self._log_timestamp = (now, timestamp)
+        if len(self._log_queue) == LOG_MAX_LINES:
+            self._log_dropped += 1
+        self._log_queue.append(f"[{timestamp}] {message}")
+        self._log_queued.emit()
+    
+    def _schedule_log_flush(self):
+        """Arm the flush timer, unless the log view is not built yet"""
+        if self.log_editor is not None and not self._log_timer.isActive():
+            self._log_timer.start()
+    
+    def _flush_logs(self):
+        """Append all queued log lines to the log view in one batch"""
+        if self.log_editor is None or not self._log_queue:
+            return
+        batch = []
+        if self._log_dropped:
+            batch.append(f"... {self._log_dropped} earlier lines dropped")
+            self._log_dropped = 0
+        while True:
+            try:
+                batch.append(self._log_queue.popleft())
+            except IndexError:
+                break
+        self.log_editor.appendPlainText("\n".join(batch))
     
     def connect_to_automation(self):
         """Connect to automation controller"""
@@ -496,56 +802,46 @@ class AutomatedAPITester(QMainWindow):
             'username': username,
             'password': password
         }
+        self._base_domain = urlparse(url).netloc
         
-        # Start auto-login in thread
+        # Start auto-login on the worker pool
         self.is_automating = True
         self.auto_login_btn.setEnabled(False)
         self.auto_login_btn.setText("Logging in...")
         
-        thread = threading.Thread(target=self.perform_auto_login, daemon=True)
-        thread.start()
+        worker = Worker(self.perform_auto_login)
+        worker.signals.finished.connect(lambda message: self.login_completed(True, message))
+        worker.signals.failed.connect(lambda error: self.login_completed(False, error))
+        self.thread_pool.start(worker)
     
     def perform_auto_login(self):
-        """Perform automated login"""
-        try:
-            self.log_message("Starting auto-login...")
-            
-            # Extract domain
-            domain = urlparse(self.credentials['url']).netloc
-            
-            # Get or create session
-            if self.session_mgr:
-                session = self.session_mgr.get_session_for_domain(domain, create_if_missing=True)
-                if session:
-                    self.current_session = session['id']
-                    self.log_message(f"Session created: {self.current_session}")
-            
-            # Perform login (this would use Selenium or requests)
-            # For now, simulate login
-            time.sleep(2)
-            
-            # Check for CAPTCHA
-            captcha_detected = self.detect_captcha()
-            if captcha_detected and self.captcha_solver:
-                self.log_message("CAPTCHA detected, solving...")
-                solution = self.captcha_solver.solve(captcha_detected)
-                if solution:
-                    self.log_message(f"CAPTCHA solved: {solution}")
-            
-            # Perform login request
-            self.log_message("Sending login request...")
-            
-            # Update UI in main thread
-            QMetaObject.invokeMethod(self, "login_completed", 
-                                   Qt.QueuedConnection,
-                                   Q_ARG(bool, True),
-                                   Q_ARG(str, "Login successful"))
-            
-        except Exception as e:
-            QMetaObject.invokeMethod(self, "login_completed",
-                                   Qt.QueuedConnection,
-                                   Q_ARG(bool, False),
-                                   Q_ARG(str, str(e)))
+        """Perform automated login (runs on a worker thread)"""
+        self.log_message("Starting auto-login...")
+        
+        # Get or create session
+        if self.session_mgr:
+            session = self.session_mgr.get_session_for_domain(self._base_domain,
+                                                              create_if_missing=True)
+            if session:
+                self.current_session = session['id']
+                self.log_message(f"Session created: {self.current_session}")
+        
+        # Perform login (this would use Selenium or requests)
+        # For now, simulate login
+        time.sleep(2)
+        
+        # Check for CAPTCHA
+        captcha_detected = self.detect_captcha()
+        if captcha_detected and self.captcha_solver:
+            self.log_message("CAPTCHA detected, solving...")
+            solution = self.captcha_solver.solve(captcha_detected)
+            if solution:
+                self.log_message(f"CAPTCHA solved: {solution}")
+        
+        # Perform login request
+        self.log_message("Sending login request...")
+        
+        return "Login successful"
     
     def login_completed(self, success, message):
         """Handle login completion"""
@@ -554,6 +850,8 @@ class AutomatedAPITester(QMainWindow):
         self.auto_login_btn.setText("🚀 Start Auto-Login")
         
         if success:
+            # Cookies may have changed with the new login
+            self._session_cache.pop(self.current_session, None)
             self.log_message(f"✅ {message}")
             self.status_bar.showMessage("Auto-login successful")
             
@@ -584,107 +882,160 @@ class AutomatedAPITester(QMainWindow):
         
         self.log_message(f"Starting auto-fetch from: {endpoint}")
         
-        # Start fetch in thread
-        thread = threading.Thread(target=self.perform_auto_fetch, daemon=True)
-        thread.start()
+        self.run_fetch()
     
-    def perform_auto_fetch(self):
-        """Perform automated data fetching"""
+    def run_fetch(self):
+        """Build the request from the UI and send it on the worker pool"""
         try:
-            # Get session headers
-            headers = {}
-            if self.session_mgr and self.current_session:
-                session = self.session_mgr.get_session(self.current_session)
-                if session and session.get('cookies'):
-                    headers['Cookie'] = '; '.join(
-                        [f"{k}={v}" for k, v in session['cookies'].items()]
-                    )
-            
-            # Get method and endpoint
-            method = self.method_combo.currentText()
-            endpoint = self.endpoint_input.text().strip()
-            url = self.credentials['url'] if self.credentials else ""
-            full_url = url + endpoint if url else endpoint
-            
-            # Prepare request
-            request_data = {
-                'method': method,
-                'url': full_url,
-                'headers': headers,
-                'timeout': 30
-            }
-            
-            # Add parameters/body based on active tab
-            current_tab = self.data_tabs.currentIndex()
-            
-            if current_tab == 0:  # Parameters
-                params = self.get_table_data(self.params_table)
-                if params:
-                    request_data['params'] = params
-            
-            elif current_tab == 1:  # JSON
-                json_body = self.json_editor.toPlainText().strip()
-                if json_body:
-                    try:
-                        json.loads(json_body)
-                        request_data['json'] = json.loads(json_body)
-                        headers['Content-Type'] = 'application/json'
-                    except:
-                        self.log_message("Invalid JSON, sending as text")
-                        request_data['data'] = json_body.encode()
-            
-            elif current_tab == 2:  # Form data
-                form_data = self.get_table_data(self.form_table)
-                if form_data:
-                    request_data['data'] = form_data
-            
-            # Send request
-            start_time = time.time()
-            response = requests.request(**request_data)
-            elapsed = time.time() - start_time
-            
-            # Update UI
-            QMetaObject.invokeMethod(self, "fetch_completed",
-                                   Qt.QueuedConnection,
-                                   Q_ARG(object, response),
-                                   Q_ARG(float, elapsed))
-            
+            request_data, domain = self.build_fetch_request()
         except Exception as e:
-            QMetaObject.invokeMethod(self, "fetch_failed",
-                                   Qt.QueuedConnection,
-                                   Q_ARG(str, str(e)))
+            self.fetch_failed(str(e))
+            return
+        
+        worker = Worker(self.perform_auto_fetch, request_data, domain)
+        worker.signals.finished.connect(lambda result: self.fetch_completed(*result))
+        worker.signals.failed.connect(self.fetch_failed)
+        self.thread_pool.start(worker)
+    
+    def build_fetch_request(self):
+        """Collect request arguments from the UI (runs on the UI thread)"""
+        # Get session headers
+        headers = {}
+        if self.session_mgr and self.current_session:
+            session = self._get_session_cached(self.current_session)
+            if session and session['cookie_header']:
+                headers['Cookie'] = session['cookie_header']
+        
+        # Get method and endpoint
+        method = self.method_combo.currentText()
+        endpoint = self.endpoint_input.text().strip()
+        if self.credentials and '://' not in endpoint:
+            full_url = urljoin(self.credentials['url'], endpoint)
+            domain = self._base_domain
+        else:
+            full_url = endpoint
+            domain = urlparse(endpoint).netloc
+        
+        # Prepare request
+        request_data = {
+            'method': method,
+            'url': full_url,
+            'headers': headers,
+            'timeout': 30
+        }
+        
+        # Add parameters/body based on active tab
+        current_tab = self.data_tabs.currentIndex()
+        
+        if current_tab == 0:  # Parameters
+            params = self.get_table_data(self.params_table)
+            if params:
+                request_data['params'] = params
+        
+        elif current_tab == 1:  # JSON
+            json_body = self.json_editor.toPlainText().strip()
+            if json_body:
+                try:
+                    parsed = _json_loads(json_body)
+                except ValueError:
+                    self.log_message("Invalid JSON, sending as text")
+                    request_data['data'] = json_body.encode()
+                else:
+                    request_data['json'] = parsed
+                    headers['Content-Type'] = 'application/json'
+        
+        elif current_tab == 2:  # Form data
+            form_data = self.get_table_data(self.form_table)
+            if form_data:
+                request_data['data'] = form_data
+        
+        return request_data, domain
     
-    def fetch_completed(self, response, elapsed):
+    def perform_auto_fetch(self, request_data, domain):
+        """Send a prepared request (runs on a worker thread)"""
+        start_time = time.time()
+        http_session = self._get_http_session(domain)
+        
+        # Stream the body so the connection goes back to the pool as soon
+        # as it is read, and stop reading once MAX_RESPONSE_BYTES is reached
+        chunks = []
+        total = 0
+        truncated = False
+        with http_session.request(stream=True, **request_data) as response:
+            for chunk in response.iter_content(chunk_size=64 * 1024):
+                chunks.append(chunk)
+                total += len(chunk)
+                if total >= MAX_RESPONSE_BYTES:
+                    truncated = True
+                    break
+            result = {
+                'method': response.request.method,
+                'url': response.request.url,
+                'status_code': response.status_code,
+                'reason': response.reason,
+                'headers': dict(response.headers),
+                'encoding': response.encoding,
+                'content': b''.join(chunks)[:MAX_RESPONSE_BYTES],
+                'truncated': truncated
+            }
+        
+        elapsed = time.time() - start_time
+        return result, elapsed
+    
+    def fetch_completed(self, result, elapsed):
         """Handle fetch completion"""
+        raw = result['content']
+        
         # Update response info
-        self.status_label.setText(f"Status: {response.status_code} {response.reason}")
+        self.status_label.setText(f"Status: {result['status_code']} {result['reason']}")
         self.time_label.setText(f"Time: {elapsed:.2f}s")
-        self.size_label.setText(f"Size: {len(response.content)} bytes")
+        if result['truncated']:
+            self.size_label.setText(f"Size: >{len(raw)} bytes (cut off)")
+        else:
+            self.size_label.setText(f"Size: {len(raw)} bytes")
         
-        # Display response
+        # Display response, parsing and pretty-printing JSON in one pass
+        is_json = True
         try:
-            json_data = response.json()
-            formatted = json.dumps(json_data, indent=2)
+            formatted = _json_dumps(_json_loads(raw), pretty=True).decode('utf-8')
+        except ValueError:
+            is_json = False
+            try:
+                formatted = raw.decode(result['encoding'] or 'utf-8', errors='replace')
+            except LookupError:
+                formatted = raw.decode('utf-8', errors='replace')
+        self._last_response_bytes = raw
+        self._last_response_text = formatted
+        self._last_response_is_json = is_json
+        if len(formatted) > RESPONSE_PREVIEW_CHARS:
+            hidden = len(formatted) - RESPONSE_PREVIEW_CHARS
+            self.response_editor.setPlainText(formatted[:RESPONSE_PREVIEW_CHARS])
+            self.response_editor.appendPlainText(
+                f"\n… (truncated, {hidden} more characters — use Copy Response)"
+            )
+        else:
             self.response_editor.setPlainText(formatted)
-        except:
-            self.response_editor.setPlainText(response.text)
         
         # Display headers
-        headers_text = ""
-        for key, value in response.headers.items():
-            headers_text += f"{key}: {value}\n"
-        self.headers_editor.setPlainText(headers_text)
+        self._headers_text = "\n".join(
+            f"{key}: {value}" for key, value in result['headers'].items()
+        )
+        if self.headers_editor is not None:
+            self.headers_editor.setPlainText(self._headers_text)
         
         # Add to captured requests
-        self.add_captured_request(response, elapsed)
+        self.add_captured_request(result, elapsed)
         
         # Log
-        self.log_message(f"✅ Fetch completed: {response.status_code} ({elapsed:.2f}s)")
+        self.log_message(f"✅ Fetch completed: {result['status_code']} ({elapsed:.2f}s)")
         self.status_bar.showMessage("Auto-fetch completed")
     
     def fetch_failed(self, error):
         """Handle fetch failure"""
-        self.response_editor.setPlainText(f"Error: {error}")
+        self._last_response_bytes = None
+        self._last_response_text = f"Error: {error}"
+        self._last_response_is_json = False
+        self.response_editor.setPlainText(self._last_response_text)
         self.log_message(f"❌ Fetch failed: {error}")
         self.status_bar.showMessage(f"Fetch failed: {error}")
     
@@ -708,14 +1059,16 @@ class AutomatedAPITester(QMainWindow):
     def get_table_data(self, table):
         """Get data from table as dictionary"""
         data = {}
+        item = table.item
         for row in range(table.rowCount()):
-            key_item = table.item(row, 0)
-            value_item = table.item(row, 1)
-            
-            if key_item and key_item.text().strip():
-                key = key_item.text().strip()
-                value = value_item.text().strip() if value_item else ""
-                data[key] = value
+            key_item = item(row, 0)
+            if key_item is None:
+                continue
+            key = key_item.text().strip()
+            if not key:
+                continue
+            value_item = item(row, 1)
+            data[key] = value_item.text().strip() if value_item is not None else ""
         
         return data
     
@@ -725,64 +1078,47 @@ class AutomatedAPITester(QMainWindow):
             QMessageBox.warning(self, "Warning", "No active session")
             return
         
-        session = self.session_mgr.get_session(self.current_session)
+        session = self._get_session_cached(self.current_session)
         if not session:
             return
         
-        # Clear current headers
-        self.headers_table.setRowCount(0)
+        rows = []
         
         # Add cookies as headers
-        cookies = session.get('cookies', {})
-        if cookies:
-            row = self.headers_table.rowCount()
-            self.headers_table.insertRow(row)
-            self.headers_table.setItem(row, 0, QTableWidgetItem("Cookie"))
-            cookie_value = '; '.join([f"{k}={v}" for k, v in cookies.items()])
-            self.headers_table.setItem(row, 1, QTableWidgetItem(cookie_value))
+        if session['cookie_header']:
+            rows.append(("Cookie", session['cookie_header']))
         
         # Add other headers from session
-        headers = session.get('headers', {})
-        for key, value in headers.items():
-            row = self.headers_table.rowCount()
-            self.headers_table.insertRow(row)
-            self.headers_table.setItem(row, 0, QTableWidgetItem(key))
-            self.headers_table.setItem(row, 1, QTableWidgetItem(str(value)))
+        headers = session.get('headers') or {}
+        rows.extend((key, str(value)) for key, value in headers.items())
+        
+        # Replace current headers in one batch
+        with _batch_updates(self.headers_table) as table:
+            table.setRowCount(len(rows))
+            for row, (key, value) in enumerate(rows):
+                table.setItem(row, 0, QTableWidgetItem(key))
+                table.setItem(row, 1, QTableWidgetItem(value))
         
         self.log_message("Loaded headers from session")
     
     def send_manual_request(self):
         """Send manual request"""
         # Similar to auto-fetch but without automation
-        thread = threading.Thread(target=self.perform_auto_fetch, daemon=True)
-        thread.start()
+        self.run_fetch()
     
-    def add_captured_request(self, response, elapsed):
+    def add_captured_request(self, result, elapsed):
         """Add request to captured table"""
-        row = self.captured_table.rowCount()
-        self.captured_table.insertRow(row)
-        
-        # Method
-        self.captured_table.setItem(row, 0, 
-                                  QTableWidgetItem(response.request.method))
-        
-        # URL
-        url = response.request.url
+        url = result['url']
         if len(url) > 50:
             url = url[:47] + "..."
-        self.captured_table.setItem(row, 1, QTableWidgetItem(url))
-        
-        # Status
-        self.captured_table.setItem(row, 2, 
-                                  QTableWidgetItem(str(response.status_code)))
         
-        # Time
-        self.captured_table.setItem(row, 3, 
-                                  QTableWidgetItem(f"{elapsed:.2f}s"))
-        
-        # Size
-        self.captured_table.setItem(row, 4, 
-                                  QTableWidgetItem(f"{len(response.content)} B"))
+        self.captured_model.append_row((
+            result['method'],
+            url,
+            str(result['status_code']),
+            f"{elapsed:.2f}s",
+            f"{len(result['content'])} B"
+        ))
     
     def load_captured_request(self, index):
         """Load captured request into editor"""
@@ -792,8 +1128,12 @@ class AutomatedAPITester(QMainWindow):
     
     def copy_response(self):
         """Copy response to clipboard"""
-        clipboard = QApplication.clipboard()
-        clipboard.setText(self.response_editor.toPlainText())
+        # Offer the raw JSON alongside the text so paste targets can pick it
+        mime = QMimeData()
+        mime.setText(self._last_response_text)
+        if self._last_response_is_json:
+            mime.setData('application/json', QByteArray(self._last_response_bytes))
+        QApplication.clipboard().setMimeData(mime)
         self.status_bar.showMessage("Response copied to clipboard")
     
     def save_request(self):
@@ -818,16 +1158,24 @@ class AutomatedAPITester(QMainWindow):
             }
             
             try:
-                with open(file_path, 'w') as f:
-                    json.dump(request_data, f, indent=2)
+                # Write to a temp file and swap it in so a crash never
+                # leaves a half-written save behind
+                tmp_path = Path(file_path + '.tmp')
+                tmp_path.write_bytes(_json_dumps(request_data, pretty=True))
+                tmp_path.replace(file_path)
                 self.log_message(f"Request saved to: {file_path}")
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Save failed: {e}")
     
     def clear_results(self):
         """Clear results display"""
+        self._last_response_bytes = None
+        self._last_response_text = ""
+        self._last_response_is_json = False
         self.response_editor.clear()
-        self.headers_editor.clear()
+        self._headers_text = ""
+        if self.headers_editor is not None:
+            self.headers_editor.clear()
         self.status_label.setText("Status: --")
         self.time_label.setText("Time: --")
         self.size_label.setText("Size: --")
@@ -835,10 +1183,10 @@ class AutomatedAPITester(QMainWindow):
     
     def clear_data(self):
         """Clear all data"""
-        self.captured_table.setRowCount(0)
-        self.headers_table.setRowCount(0)
-        self.params_table.setRowCount(0)
-        self.form_table.setRowCount(0)
+        self.captured_model.clear()
+        for table in (self.headers_table, self.params_table, self.form_table):
+            with _batch_updates(table):
+                table.setRowCount(0)
         self.json_editor.clear()
         self.clear_results()
         self.log_message("All data cleared")
@@ -865,9 +1213,22 @@ class AutomatedAPITester(QMainWindow):
             # Export logic here
             self.log_message(f"Data exported to: {file_path}")
 
+    def closeEvent(self, event):
+        """Handle window close"""
+        with self._sessions_lock:
+            for session in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+        
+        # A proxy belongs to the controller, which closes it itself
+        if self.session_mgr is not None and not isinstance(self.session_mgr, BaseProxy):
+            self.session_mgr.close()
+        event.accept()
+
 def main():
     """Start automated API tester"""
     app = QApplication(sys.argv)
+    app.setStyleSheet(AutomatedAPITester._STYLESHEET)
     
     # Check for automation mode from command line
     automation_mode = "--auto" in sys.argv or "-a" in sys.argv
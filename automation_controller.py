@@ -9,11 +9,181 @@ import sys
 import json
 import time
 import threading
+import socket
 import subprocess
+import types
+import signal
+import select
+import selectors
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor, wait
 from datetime import datetime
+from functools import lru_cache
+from multiprocessing.managers import BaseManager
+from urllib.parse import urlsplit
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
+from session_manager import SessionManager
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Activity log lines kept in the controller window
+LOG_MAX_LINES = 500
+
+# Application stylesheet, parsed once by QApplication in main()
+_STYLESHEET = """
+QMainWindow {
+    background-color: #1e1e1e;
+}
+QWidget {
+    background-color: #2d2d2d;
+    color: #ffffff;
+    font-family: 'Segoe UI', Arial, sans-serif;
+}
+QGroupBox {
+    font-weight: bold;
+    border: 1px solid #444;
+    border-radius: 5px;
+    margin-top: 10px;
+    padding-top: 10px;
+}
+QGroupBox::title {
+    subcontrol-origin: margin;
+    left: 10px;
+    padding: 0 5px 0 5px;
+}
+QPushButton {
+    background-color: #4e4e4e;
+    color: white;
+    border: 1px solid #555;
+    border-radius: 3px;
+    padding: 8px 15px;
+    font-weight: bold;
+}
+QPushButton:hover {
+    background-color: #5e5e5e;
+}
+QPushButton:pressed {
+    background-color: #3e3e3e;
+}
+QTableWidget {
+    background-color: #3e3e3e;
+    border: 1px solid #555;
+    alternate-background-color: #4e4e4e;
+}
+QHeaderView::section {
+    background-color: #3e3e3e;
+    padding: 5px;
+    border: 1px solid #555;
+}
+QTextEdit {
+    background-color: #3e3e3e;
+    border: 1px solid #555;
+    border-radius: 3px;
+}
+QCheckBox {
+    spacing: 8px;
+}
+QCheckBox::indicator {
+    width: 18px;
+    height: 18px;
+}
+"""
+
+# Environment handed to spawned tools so they can reach the shared SessionManager
+SESSION_SERVER_ENV = 'TURBOX_SESSION_SERVER'
+SESSION_AUTHKEY_ENV = 'TURBOX_SESSION_AUTHKEY'
+
+# URLs that look like a login/auth endpoint
+_LOGIN_RE = re.compile(r'login|auth', re.I)
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj, pretty=False):
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode('utf-8')
+
+@lru_cache(maxsize=4096)
+def _classify_url(url):
+    """Return (domain, is_login) for a captured request URL"""
+    parts = urlsplit(url)
+    domain = parts.netloc or parts.path.split('/', 1)[0]
+    return domain, bool(_LOGIN_RE.search(url))
+
+class SessionServer(BaseManager):
+    """Serves the controller's SessionManager to tool processes"""
+
+class SpawnedProcess:
+    """Minimal Popen-like handle for a child started with os.posix_spawn"""
+    
+    def __init__(self, argv):
+        self.args = argv
+        self.pid = os.posix_spawn(argv[0], argv, os.environ)
+        self.returncode = None
+    
+    def poll(self):
+        """Reap the child if it has exited and return its exit code"""
+        if self.returncode is None:
+            try:
+                pid, status = os.waitpid(self.pid, os.WNOHANG)
+            except ChildProcessError:
+                self.returncode = -1
+                return self.returncode
+            if pid:
+                self.returncode = os.waitstatus_to_exitcode(status)
+        return self.returncode
+    
+    def wait(self, timeout=None):
+        """Block until the child exits, raising TimeoutExpired like Popen"""
+        if timeout is not None:
+            # waitpid has no timeout; back off between polls as Popen does
+            deadline = time.monotonic() + timeout
+            delay = 0.0005
+            while self.poll() is None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise subprocess.TimeoutExpired(self.args, timeout)
+                time.sleep(min(delay, remaining))
+                delay = min(delay * 2, 0.05)
+            return self.returncode
+        
+        if self.returncode is None:
+            try:
+                _, status = os.waitpid(self.pid, 0)
+                self.returncode = os.waitstatus_to_exitcode(status)
+            except ChildProcessError:
+                self.returncode = -1
+        return self.returncode
+    
+    def send_signal(self, sig):
+        """Signal the child unless it is already reaped"""
+        if self.poll() is None:
+            os.kill(self.pid, sig)
+    
+    def terminate(self):
+        """Ask the child to exit"""
+        self.send_signal(signal.SIGTERM)
+    
+    def kill(self):
+        """Force the child to exit"""
+        self.send_signal(signal.SIGKILL)
+
+def _spawn(argv):
+    """Start a pipe-less child, preferring posix_spawn over fork+exec"""
+    if hasattr(os, 'posix_spawn'):
+        return SpawnedProcess(argv)
+    return subprocess.Popen(argv)
 
 class AutomationController:
     """Central controller for automatic tool management"""
@@ -26,6 +196,10 @@ class AutomationController:
         # Load configuration
         self.config = self._load_config()
         
+        # Serialized config last written to disk, guarded for pooled saves
+        self._last_written_bytes = None
+        self._save_lock = threading.Lock()
+        
         # Running tools
         self.running_tools = {
             'api_tester': None,
@@ -34,12 +208,47 @@ class AutomationController:
             'session_manager': None
         }
         
+        # pid -> tool name, for matching exited children
+        self._pid_tools = {}
+        
+        # Guards running_tools, _pid_tools and _launching; launches run on
+        # pool threads alongside the monitor
+        self._tools_lock = threading.RLock()
+        self._launching = set()
+        
         # Browser connection state
         self.browser_connected = False
         self.last_browser_activity = None
+        # time.monotonic() of the same event, for cheap idle arithmetic
+        self.last_browser_activity_mono = None
+        
+        # get_status() result, rebuilt only after a state change
+        self._status_cache = None
+        self._status_dirty = True
         
         # Automation rules
         self.automation_rules = self.config.get('automation_rules', {})
+        # Read-only view for hot paths; rebuilt by set_rule on change
+        self._rules_snapshot = types.MappingProxyType(dict(self.automation_rules))
+        
+        # Shared SessionManager and its server, started before the first tool launch
+        self._session_mgr = None
+        self._session_server = None
+        self._session_server_lock = threading.Lock()
+        
+        # Service tool output, multiplexed onto one pump thread
+        self._log_selector = selectors.DefaultSelector()
+        self._log_pump = None
+        self._log_pump_lock = threading.Lock()
+        
+        # Wake the monitor on SIGCHLD instead of polling
+        self._wakeup_fd = self._install_child_watcher()
+        
+        # Second self-pipe so browser events can wake the monitor to re-arm
+        # its idle timeout
+        self._browser_wake_r, self._browser_wake_w = os.pipe()
+        os.set_blocking(self._browser_wake_r, False)
+        os.set_blocking(self._browser_wake_w, False)
         
         # Start monitoring
         self.monitor_thread = threading.Thread(target=self._monitor_tools, daemon=True)
@@ -69,8 +278,8 @@ class AutomationController:
         
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
+                with open(self.config_file, 'rb') as f:
+                    config = _json_loads(f.read())
                 
                 # Merge with defaults
                 for key, value in default_config.items():
@@ -85,24 +294,134 @@ class AutomationController:
             print(f"⚠️ Config load error: {e}")
             return default_config
     
+    def _install_child_watcher(self):
+        """Route SIGCHLD to a self-pipe the monitor thread can block on"""
+        if not hasattr(signal, 'SIGCHLD'):
+            return None
+        
+        try:
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(read_fd, False)
+            os.set_blocking(write_fd, False)
+            # The handler itself is a no-op; the C-level wakeup byte is what
+            # rouses the monitor, even while the main thread sits in Qt
+            signal.signal(signal.SIGCHLD, lambda signum, frame: None)
+            signal.set_wakeup_fd(write_fd)
+            return read_fd
+        except (ValueError, OSError) as e:
+            # Not on the main thread, or no pipes - fall back to polling
+            print(f"⚠️ Child watcher unavailable, polling instead: {e}")
+            return None
+    
+    def _wait_for_child_event(self, timeout):
+        """Sleep until a child changes state or the timeout elapses"""
+        if self._wakeup_fd is None:
+            time.sleep(10 if timeout is None else min(timeout, 10))
+            return
+        
+        ready, _, _ = select.select([self._wakeup_fd, self._browser_wake_r], [], [], timeout)
+        for fd in ready:
+            try:
+                while os.read(fd, 512):
+                    pass
+            except BlockingIOError:
+                pass
+    
+    def _wake_monitor(self):
+        """Interrupt the monitor's wait so it recomputes its timeout"""
+        try:
+            os.write(self._browser_wake_w, b'\0')
+        except BlockingIOError:
+            # Pipe already full - the monitor is waking anyway
+            pass
+    
+    @property
+    def session_mgr(self):
+        """Shared SessionManager, built once on first use"""
+        if self._session_mgr is None:
+            # Manager server threads, the monitor and the UI can all race here
+            with self._session_server_lock:
+                if self._session_mgr is None:
+                    self._session_mgr = SessionManager()
+        return self._session_mgr
+    
+    def dump_config(self):
+        """Serialize the current configuration to bytes"""
+        return _json_dumps(self.config, pretty=True)
+    
     def save_config(self):
         """Save configuration to file"""
+        return self.write_config(self.dump_config())
+    
+    def write_config(self, data):
+        """Atomically write serialized configuration, skipping no-op writes"""
+        with self._save_lock:
+            if data == self._last_written_bytes:
+                return True
+            
+            try:
+                os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
+                tmp_file = self.config_file + '.tmp'
+                with open(tmp_file, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, self.config_file)
+                self._last_written_bytes = data
+                return True
+            except Exception as e:
+                print(f"❌ Config save error: {e}")
+                return False
+    
+    def _ensure_session_server(self):
+        """Expose session_mgr over a local manager socket for child tools"""
+        with self._session_server_lock:
+            if self._session_server is None:
+                self._start_session_server()
+    
+    def _start_session_server(self):
+        """Start the manager server and export its address to children"""
         try:
-            os.makedirs(os.path.dirname(self.config_file), exist_ok=True)
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
-            return True
+            authkey = os.urandom(16)
+            SessionServer.register('get_session_manager', callable=lambda: self.session_mgr)
+            manager = SessionServer(address=('127.0.0.1', 0), authkey=authkey)
+            self._session_server = manager.get_server()
+            threading.Thread(target=self._session_server.serve_forever, daemon=True).start()
+            
+            # Children inherit these through the spawn environment
+            host, port = self._session_server.address
+            os.environ[SESSION_SERVER_ENV] = f"{host}:{port}"
+            os.environ[SESSION_AUTHKEY_ENV] = authkey.hex()
         except Exception as e:
-            print(f"❌ Config save error: {e}")
-            return False
+            print(f"⚠️ Session server unavailable: {e}")
+            self._session_server = False
+    
+    def set_rule(self, key, value):
+        """Change an automation rule and publish a fresh snapshot"""
+        self.automation_rules[key] = value
+        self._rules_snapshot = types.MappingProxyType(dict(self.automation_rules))
+        self._status_dirty = True
+    
+    def _set_tool(self, tool_name, tool_info):
+        """Record a tool's process info (None when stopped)"""
+        with self._tools_lock:
+            previous = self.running_tools.get(tool_name)
+            if previous and self._pid_tools.get(previous.get('pid')) == tool_name:
+                del self._pid_tools[previous['pid']]
+            if tool_info:
+                self._pid_tools[tool_info['pid']] = tool_name
+            
+            self.running_tools[tool_name] = tool_info
+            self._status_dirty = True
     
     def launch_tool(self, tool_name, auto_restart=True):
         """Launch a tool automatically"""
-        try:
-            if self.running_tools.get(tool_name):
+        # Claim the tool so a concurrent launch of the same one backs off
+        with self._tools_lock:
+            if self.running_tools.get(tool_name) or tool_name in self._launching:
                 print(f"⚠️ {tool_name} is already running")
                 return True
-            
+            self._launching.add(tool_name)
+        
+        try:
             script_path = None
             
             if tool_name == 'api_tester':
@@ -116,24 +435,21 @@ class AutomationController:
                 return True
             
             if script_path and os.path.exists(script_path):
+                self._ensure_session_server()
+                
                 # Launch tool
                 if tool_name in ['api_tester', 'sms_panel']:
                     # GUI tools - run in separate process
-                    process = subprocess.Popen([sys.executable, script_path])
-                    self.running_tools[tool_name] = {
+                    process = _spawn([sys.executable, script_path])
+                    self._set_tool(tool_name, {
                         'process': process,
                         'pid': process.pid,
                         'started': datetime.now().isoformat(),
                         'auto_restart': auto_restart
-                    }
+                    })
                 else:
-                    # Service tools - run in thread
-                    thread = threading.Thread(
-                        target=self._run_tool_script,
-                        args=(tool_name, script_path),
-                        daemon=True
-                    )
-                    thread.start()
+                    # Service tools - output relayed by the shared log pump
+                    self._run_tool_script(tool_name, script_path)
                 
                 print(f"🚀 Launched {tool_name}")
                 return True
@@ -144,56 +460,108 @@ class AutomationController:
         except Exception as e:
             print(f"❌ Launch error for {tool_name}: {e}")
             return False
+        
+        finally:
+            with self._tools_lock:
+                self._launching.discard(tool_name)
     
     def _run_tool_script(self, tool_name, script_path):
-        """Run a tool script in thread"""
-        try:
-            process = subprocess.Popen(
-                [sys.executable, script_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
-            )
-            
-            self.running_tools[tool_name] = {
-                'process': process,
-                'pid': process.pid,
-                'started': datetime.now().isoformat(),
-                'auto_restart': True
-            }
-            
-            # Monitor output
-            for line in process.stdout:
-                print(f"[{tool_name}] {line.strip()}")
-            
-            # Check exit
-            process.wait()
-            print(f"📤 {tool_name} exited with code {process.returncode}")
+        """Start a service tool and hand its output to the log pump"""
+        process = subprocess.Popen(
+            [sys.executable, script_path],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT
+        )
+        
+        self._set_tool(tool_name, {
+            'process': process,
+            'pid': process.pid,
+            'started': datetime.now().isoformat(),
+            'auto_restart': True
+        })
+        
+        os.set_blocking(process.stdout.fileno(), False)
+        self._log_selector.register(process.stdout, selectors.EVENT_READ, data=tool_name)
+        
+        # One pump thread serves every tool, started with the first one
+        with self._log_pump_lock:
+            if self._log_pump is None:
+                self._log_pump = threading.Thread(target=self._pump_tool_output, daemon=True)
+                self._log_pump.start()
+    
+    def _pump_tool_output(self):
+        """Relay output from all service tools on a single thread"""
+        pending = {}
+        
+        while True:
+            try:
+                events = self._log_selector.select()
+            except OSError as e:
+                print(f"⚠️ Log pump error: {e}")
+                time.sleep(1)
+                continue
             
-        except Exception as e:
-            print(f"❌ {tool_name} thread error: {e}")
-        finally:
-            self.running_tools[tool_name] = None
+            for key, _ in events:
+                tool_name = key.data
+                try:
+                    chunk = os.read(key.fd, 65536)
+                except BlockingIOError:
+                    continue
+                except OSError:
+                    chunk = b''
+                
+                if chunk:
+                    pending[key.fd] = self._forward_output(
+                        tool_name, pending.get(key.fd, b'') + chunk
+                    )
+                    continue
+                
+                # EOF - the tool closed its output, normally by exiting;
+                # the monitor thread handles restart bookkeeping
+                rest = pending.pop(key.fd, b'')
+                if rest:
+                    self._forward_output(tool_name, rest + b'\n')
+                self._log_selector.unregister(key.fileobj)
+                key.fileobj.close()
+                print(f"📤 {tool_name} closed its output")
+    
+    def _forward_output(self, tool_name, data):
+        """Echo complete lines from a tool, returning any partial trailing line"""
+        *lines, partial = data.split(b'\n')
+        if lines:
+            prefix = f"[{tool_name}] "
+            text = ''.join(
+                f"{prefix}{line.decode('utf-8', 'replace').strip()}\n" for line in lines
+            )
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        return partial
     
     def stop_tool(self, tool_name):
         """Stop a running tool"""
+        # Detach first so the monitor does not take the exit for a crash
+        # and auto-restart the tool while we are stopping it
+        with self._tools_lock:
+            tool_info = self.running_tools.get(tool_name)
+            if tool_info:
+                self._set_tool(tool_name, None)
+        
+        if not tool_info:
+            print(f"⚠️ {tool_name} is not running")
+            return False
+        
         try:
-            if tool_name in self.running_tools and self.running_tools[tool_name]:
-                tool_info = self.running_tools[tool_name]
-                
-                if 'process' in tool_info and tool_info['process']:
-                    tool_info['process'].terminate()
-                    time.sleep(1)
-                    
-                    if tool_info['process'].poll() is None:
-                        tool_info['process'].kill()
-                
-                self.running_tools[tool_name] = None
-                print(f"🛑 Stopped {tool_name}")
-                return True
-            else:
-                print(f"⚠️ {tool_name} is not running")
-                return False
+            process = tool_info.get('process')
+            if process:
+                process.terminate()
+                try:
+                    process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    process.kill()
+                    process.wait(timeout=1)
+            
+            print(f"🛑 Stopped {tool_name}")
+            return True
         
         except Exception as e:
             print(f"❌ Stop error for {tool_name}: {e}")
@@ -206,18 +574,39 @@ class AutomationController:
         # Start socket bridge first (for communication)
         if self.config['auto_launch'].get('socket_bridge', True):
             self.launch_tool('socket_bridge')
-            time.sleep(2)  # Wait for socket bridge to start
-        
-        # Start API Tester
-        if self.config['auto_launch'].get('api_tester', True):
-            self.launch_tool('api_tester')
+            self._wait_for_bridge()
         
-        # Start SMS Panel
-        if self.config['auto_launch'].get('sms_panel', True):
-            self.launch_tool('sms_panel')
+        # GUI tools only depend on the bridge, so start them side by side
+        gui_tools = [name for name in ('api_tester', 'sms_panel')
+                     if self.config['auto_launch'].get(name, True)]
+        if gui_tools:
+            # Started here, once, rather than raced for by the pool threads
+            self._ensure_session_server()
+            with ThreadPoolExecutor(max_workers=len(gui_tools)) as executor:
+                wait([executor.submit(self.launch_tool, name) for name in gui_tools])
         
         print("✅ All tools launched")
     
+    def _wait_for_bridge(self, timeout=2.0):
+        """Block until the socket bridge accepts connections or timeout"""
+        port = self.config.get('browser_integration', {}).get('port', 8765)
+        deadline = time.monotonic() + timeout
+        
+        while time.monotonic() < deadline:
+            try:
+                with socket.create_connection(('localhost', port), timeout=0.05):
+                    return True
+            except OSError:
+                time.sleep(0.05)
+        
+        print("⚠️ Socket bridge not ready, continuing")
+        return False
+    
+    def close_session_manager(self):
+        """Flush and close the shared SessionManager if it was ever built"""
+        if self._session_mgr is not None:
+            self._session_mgr.close()
+    
     def stop_all_tools(self):
         """Stop all running tools"""
         print("🛑 Stopping all tools...")
@@ -232,6 +621,11 @@ class AutomationController:
         print("🌐 Browser extension connected")
         self.browser_connected = True
         self.last_browser_activity = datetime.now()
+        self.last_browser_activity_mono = time.monotonic()
+        self._status_dirty = True
+        
+        # Start the 60 s idle check
+        self._wake_monitor()
         
         # Auto-launch tools if configured
         if self.config['auto_launch'].get('on_browser_connect', True):
@@ -244,6 +638,10 @@ class AutomationController:
         """Handle browser extension disconnection"""
         print("🌐 Browser extension disconnected")
         self.browser_connected = False
+        self._status_dirty = True
+        
+        # Drop remembered URLs from the finished browsing session
+        _classify_url.cache_clear()
         
         # Notify tools
         self._notify_tools('browser_disconnected', {})
@@ -251,6 +649,9 @@ class AutomationController:
     def on_browser_data(self, data):
         """Handle data from browser extension"""
         self.last_browser_activity = datetime.now()
+        self.last_browser_activity_mono = time.monotonic()
+        self._status_dirty = True
+        rules = self._rules_snapshot
         
         # Process captured requests
         requests = data.get('requests', [])
@@ -261,12 +662,12 @@ class AutomationController:
             self._notify_tools('new_requests', {'requests': requests})
             
             # Auto-process if configured
-            if self.automation_rules.get('auto_session', True):
+            if rules.get('auto_session', True):
                 self._auto_process_requests(requests)
         
         # Process CAPTCHA if present
         captcha_data = data.get('captcha')
-        if captcha_data and self.automation_rules.get('auto_captcha', True):
+        if captcha_data and rules.get('auto_captcha', True):
             solution = self._solve_captcha(captcha_data)
             if solution:
                 self._notify_tools('captcha_solution', {
@@ -276,40 +677,43 @@ class AutomationController:
     
     def _auto_process_requests(self, requests):
         """Automatically process captured requests"""
-        from session_manager import SessionManager
-        
-        session_mgr = SessionManager()
+        session_mgr = self.session_mgr
         
+        # Group by domain so each session is looked up once
+        by_domain = defaultdict(list)
         for req in requests:
-            # Extract domain
             url = req.get('url', '')
             if not url:
                 continue
             
-            domain = url.split('/')[2] if '//' in url else url.split('/')[0]
-            
+            domain, is_login = _classify_url(url)
+            by_domain[domain].append((req, is_login))
+        
+        for domain, domain_requests in by_domain.items():
             # Get or create session
             session = session_mgr.get_session_for_domain(domain)
-            if session:
-                session_id = session['id']
-                
-                # Add request to session
-                session_mgr.add_captured_request(session_id, req)
-                
+            if not session:
+                continue
+            
+            session_id = session['id']
+            
+            # Add requests to session in one transaction
+            session_mgr.add_captured_requests_bulk(
+                session_id, [req for req, _ in domain_requests]
+            )
+            
+            for req, is_login in domain_requests:
                 # Extract tokens
                 session_mgr.extract_tokens_from_request(session_id, req)
                 
                 # Check for login
-                if 'login' in url.lower() or 'auth' in url.lower():
+                if is_login:
                     print(f"🔐 Detected login request for {domain}")
                     # Could trigger auto-login here
     
     def _solve_captcha(self, captcha_data):
         """Solve CAPTCHA automatically"""
-        from session_manager import SessionManager
-        
-        session_mgr = SessionManager()
-        solution = session_mgr.solve_captcha(captcha_data)
+        solution = self.session_mgr.solve_captcha(captcha_data)
         
         if solution:
             if solution.startswith('MANUAL:'):
@@ -332,40 +736,73 @@ class AutomationController:
     def _monitor_tools(self):
         """Monitor running tools and auto-restart if needed"""
         while True:
-            time.sleep(10)  # Check every 10 seconds
+            # Block until a child exits or a browser connects; only wake on
+            # a timer while the browser idle timeout is pending
+            timeout = None
+            if self.browser_connected and self.last_browser_activity_mono:
+                idle = time.monotonic() - self.last_browser_activity_mono
+                timeout = max(0.0, 60 - idle) + 0.1
+            self._wait_for_child_event(timeout)
             
             try:
-                for tool_name, tool_info in list(self.running_tools.items()):
-                    if tool_info and 'process' in tool_info:
-                        process = tool_info['process']
-                        
-                        # Check if process is still alive
-                        if process.poll() is not None:
-                            print(f"⚠️ {tool_name} has stopped (exit code: {process.returncode})")
-                            
-                            # Auto-restart if configured
-                            if tool_info.get('auto_restart', False):
-                                print(f"🔄 Auto-restarting {tool_name}...")
-                                self.launch_tool(tool_name)
-                            
-                            self.running_tools[tool_name] = None
+                for tool_name, tool_info in self._exited_tools():
+                    print(f"⚠️ {tool_name} has stopped (exit code: {tool_info['process'].returncode})")
+                    self._set_tool(tool_name, None)
+                    
+                    # Auto-restart if configured
+                    if tool_info.get('auto_restart', False):
+                        print(f"🔄 Auto-restarting {tool_name}...")
+                        self.launch_tool(tool_name)
                 
                 # Check browser connection timeout
-                if (self.browser_connected and self.last_browser_activity and 
-                    (datetime.now() - self.last_browser_activity).seconds > 60):
+                if (self.browser_connected and self.last_browser_activity_mono and 
+                    time.monotonic() - self.last_browser_activity_mono > 60):
                     print("⚠️ No browser activity for 60 seconds")
                     self.on_browser_disconnected()
             
             except Exception as e:
                 print(f"⚠️ Monitor error: {e}")
     
+    def _exited_tools(self):
+        """Reap exited tools, returning (tool_name, tool_info) pairs"""
+        exited = []
+        
+        # One waitid peeks at any exited child without reaping it, so the
+        # common "nothing happened" case costs a single syscall
+        while hasattr(os, 'waitid'):
+            try:
+                info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOHANG | os.WNOWAIT)
+            except ChildProcessError:
+                return exited
+            if info is None:
+                return exited
+            
+            tool_name = self._pid_tools.get(info.si_pid)
+            tool_info = self.running_tools.get(tool_name) if tool_name else None
+            if not tool_info or tool_info['process'].poll() is None:
+                # Not one of ours, or already reaped elsewhere - check every tool
+                break
+            exited.append((tool_name, tool_info))
+        
+        for tool_name, tool_info in list(self.running_tools.items()):
+            if tool_info and 'process' in tool_info and tool_info['process'].poll() is not None:
+                if (tool_name, tool_info) not in exited:
+                    exited.append((tool_name, tool_info))
+        return exited
+    
     def get_status(self):
         """Get current automation status"""
+        if not self._status_dirty and self._status_cache is not None:
+            return self._status_cache
+        
+        # Clear first so a change made while building marks it dirty again
+        self._status_dirty = False
         status = {
             'browser_connected': self.browser_connected,
             'last_activity': self.last_browser_activity.isoformat() if self.last_browser_activity else None,
+            'last_activity_mono': self.last_browser_activity_mono,
             'running_tools': {},
-            'automation_rules': self.automation_rules
+            'automation_rules': dict(self._rules_snapshot)
         }
         
         for tool_name, tool_info in self.running_tools.items():
@@ -378,27 +815,59 @@ class AutomationController:
             else:
                 status['running_tools'][tool_name] = {'running': False}
         
+        self._status_cache = status
         return status
 
+class SaveTask(QRunnable):
+    """Write serialized configuration off the UI thread"""
+    
+    def __init__(self, controller, data):
+        super().__init__()
+        self.controller = controller
+        self.data = data
+    
+    def run(self):
+        self.controller.write_config(self.data)
+
 class AutomationGUI(QMainWindow):
     """GUI for automation controller"""
     
+    # (display name, tool name) for each row of the tools table
+    TOOLS = (
+        ('API Tester', 'api_tester'),
+        ('SMS Panel', 'sms_panel'),
+        ('Socket Bridge', 'socket_bridge'),
+        ('Session Manager', 'session_manager')
+    )
+    
     def __init__(self, controller):
         super().__init__()
         self.controller = controller
         
+        # Last status snapshot rendered, and its content hash
+        self._last_status = None
+        self._last_status_hash = None
+        
         self.init_ui()
         
-        # Update timer
+        # Debounced config save - rapid toggles write the file once
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._flush_save)
+        
+        # One writer thread so queued saves land on disk in order
+        self._save_pool = QThreadPool(self)
+        self._save_pool.setMaxThreadCount(1)
+        
+        # Update timer - fast while the browser is talking to us, slow otherwise
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(2000)  # Update every 2 seconds
+        self.update_timer.start(5000)
     
     def init_ui(self):
         """Initialize the user interface"""
         self.setWindowTitle("TurboX Automation Controller")
         self.setGeometry(200, 200, 800, 500)
-        self.setStyleSheet(self._get_stylesheet())
         
         # Central widget
         central_widget = QWidget()
@@ -436,10 +905,11 @@ class AutomationGUI(QMainWindow):
         tools_layout = QVBoxLayout()
         
         # Tool status table
-        self.tools_table = QTableWidget(4, 3)
+        self.tools_table = QTableWidget(len(self.TOOLS), 3)
         self.tools_table.setHorizontalHeaderLabels(["Tool", "Status", "Action"])
         self.tools_table.horizontalHeader().setStretchLastSection(True)
         self.tools_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self._build_tools_rows()
         
         tools_layout.addWidget(self.tools_table)
         
@@ -488,6 +958,7 @@ class AutomationGUI(QMainWindow):
         self.log_text = QTextEdit()
         self.log_text.setReadOnly(True)
         self.log_text.setMaximumHeight(100)
+        self.log_text.document().setMaximumBlockCount(LOG_MAX_LINES)
         log_layout.addWidget(self.log_text)
         
         log_group.setLayout(log_layout)
@@ -496,86 +967,16 @@ class AutomationGUI(QMainWindow):
         # Initial update
         self.update_tools_table()
     
-    def _get_stylesheet(self):
-        """Get application stylesheet"""
-        return """
-        QMainWindow {
-            background-color: #1e1e1e;
-        }
-        QWidget {
-            background-color: #2d2d2d;
-            color: #ffffff;
-            font-family: 'Segoe UI', Arial, sans-serif;
-        }
-        QGroupBox {
-            font-weight: bold;
-            border: 1px solid #444;
-            border-radius: 5px;
-            margin-top: 10px;
-            padding-top: 10px;
-        }
-        QGroupBox::title {
-            subcontrol-origin: margin;
-            left: 10px;
-            padding: 0 5px 0 5px;
-        }
-        QPushButton {
-            background-color: #4e4e4e;
-            color: white;
-            border: 1px solid #555;
-            border-radius: 3px;
-            padding: 8px 15px;
-            font-weight: bold;
-        }
-        QPushButton:hover {
-            background-color: #5e5e5e;
-        }
-        QPushButton:pressed {
-            background-color: #3e3e3e;
-        }
-        QTableWidget {
-            background-color: #3e3e3e;
-            border: 1px solid #555;
-            alternate-background-color: #4e4e4e;
-        }
-        QHeaderView::section {
-            background-color: #3e3e3e;
-            padding: 5px;
-            border: 1px solid #555;
-        }
-        QTextEdit {
-            background-color: #3e3e3e;
-            border: 1px solid #555;
-            border-radius: 3px;
-        }
-        QCheckBox {
-            spacing: 8px;
-        }
-        QCheckBox::indicator {
-            width: 18px;
-            height: 18px;
-        }
-        """
-    
     def update_status(self):
         """Update status display"""
         status = self.controller.get_status()
+        unchanged = status is self._last_status
+        self._last_status = status
         
-        # Browser status
-        if status['browser_connected']:
-            self.browser_status_label.setText("Connected")
-            self.browser_status_label.setStyleSheet("color: #1dd1a1; font-weight: bold;")
-        else:
-            self.browser_status_label.setText("Disconnected")
-            self.browser_status_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
-        
-        # Last activity
-        last_activity = status['last_activity']
-        if last_activity:
-            from datetime import datetime
-            last_time = datetime.fromisoformat(last_activity.replace('Z', '+00:00'))
-            now = datetime.now()
-            seconds_ago = int((now - last_time).total_seconds())
+        # Last activity moves with the clock, so it is refreshed every tick
+        last_activity = status['last_activity_mono']
+        if last_activity is not None:
+            seconds_ago = int(time.monotonic() - last_activity)
             
             if seconds_ago < 60:
                 self.activity_label.setText(f"Last activity: {seconds_ago} seconds ago")
@@ -585,96 +986,147 @@ class AutomationGUI(QMainWindow):
         else:
             self.activity_label.setText("Last activity: Never")
         
+        # Everything else only changes with the controller state
+        if unchanged:
+            return
+        status_hash = hash(json.dumps(status, sort_keys=True, default=str))
+        if status_hash == self._last_status_hash:
+            return
+        self._last_status_hash = status_hash
+        
+        # Browser status
+        if status['browser_connected']:
+            self.browser_status_label.setText("Connected")
+            self.browser_status_label.setStyleSheet("color: #1dd1a1; font-weight: bold;")
+            self.update_timer.setInterval(1000)
+        else:
+            self.browser_status_label.setText("Disconnected")
+            self.browser_status_label.setStyleSheet("color: #ff6b6b; font-weight: bold;")
+            self.update_timer.setInterval(5000)
+        
+        # Reflect rule changes without re-entering the toggle handlers
+        rules = status['automation_rules']
+        for check, key in ((self.auto_captcha_check, 'auto_captcha'),
+                           (self.auto_session_check, 'auto_session')):
+            blocker = QSignalBlocker(check)
+            check.setChecked(rules.get(key, True))
+            blocker.unblock()
+        
         # Update tools table
-        self.update_tools_table()
+        self.update_tools_table(status['running_tools'])
     
-    def update_tools_table(self):
-        """Update tools table with current status"""
-        tools = [
-            ('API Tester', 'api_tester'),
-            ('SMS Panel', 'sms_panel'),
-            ('Socket Bridge', 'socket_bridge'),
-            ('Session Manager', 'session_manager')
-        ]
-        
-        self.tools_table.setRowCount(len(tools))
+    def _build_tools_rows(self):
+        """Create the tools table rows and their action buttons once"""
+        self._status_items = {}
+        self._action_buttons = {}
         
-        for i, (display_name, tool_name) in enumerate(tools):
+        for i, (display_name, tool_name) in enumerate(self.TOOLS):
             # Tool name
-            name_item = QTableWidgetItem(display_name)
-            self.tools_table.setItem(i, 0, name_item)
+            self.tools_table.setItem(i, 0, QTableWidgetItem(display_name))
             
             # Status
-            status = self.controller.running_tools.get(tool_name)
-            if status:
-                status_text = "Running"
-                status_item = QTableWidgetItem(status_text)
-                status_item.setForeground(QColor("#1dd1a1"))
-            else:
-                status_text = "Stopped"
-                status_item = QTableWidgetItem(status_text)
-                status_item.setForeground(QColor("#ff6b6b"))
-            
+            status_item = QTableWidgetItem()
             self.tools_table.setItem(i, 1, status_item)
+            self._status_items[tool_name] = status_item
             
-            # Action button
+            # Action button - one per row, relabelled as the tool changes state
             action_widget = QWidget()
             action_layout = QHBoxLayout(action_widget)
             action_layout.setContentsMargins(0, 0, 0, 0)
             
-            if status:
-                stop_btn = QPushButton("Stop")
-                stop_btn.setStyleSheet("background-color: #ff6b6b;")
-                stop_btn.clicked.connect(lambda checked, tn=tool_name: self.stop_tool(tn))
-                action_layout.addWidget(stop_btn)
-            else:
-                start_btn = QPushButton("Start")
-                start_btn.setStyleSheet("background-color: #1dd1a1;")
-                start_btn.clicked.connect(lambda checked, tn=tool_name: self.start_tool(tn))
-                action_layout.addWidget(start_btn)
-            
+            action_btn = QPushButton()
+            action_btn.clicked.connect(lambda checked, tn=tool_name: self._toggle_tool(tn))
+            action_layout.addWidget(action_btn)
             action_layout.addStretch()
+            
             self.tools_table.setCellWidget(i, 2, action_widget)
+            self._action_buttons[tool_name] = action_btn
+    
+    def update_tools_table(self, running_tools=None):
+        """Update tools table with current status"""
+        if running_tools is None:
+            running_tools = self.controller.get_status()['running_tools']
+        
+        for display_name, tool_name in self.TOOLS:
+            running = running_tools.get(tool_name, {}).get('running', False)
+            status_item = self._status_items[tool_name]
+            action_btn = self._action_buttons[tool_name]
+            
+            if running:
+                status_item.setText("Running")
+                status_item.setForeground(QColor("#1dd1a1"))
+                action_btn.setText("Stop")
+                action_btn.setStyleSheet("background-color: #ff6b6b;")
+            else:
+                status_item.setText("Stopped")
+                status_item.setForeground(QColor("#ff6b6b"))
+                action_btn.setText("Start")
+                action_btn.setStyleSheet("background-color: #1dd1a1;")
         
         self.tools_table.resizeColumnsToContents()
     
+    def _log(self, message):
+        """Append a timestamped line to the activity log"""
+        self.log_text.append(f"[{time.strftime('%H:%M:%S')}] {message}")
+    
+    def _toggle_tool(self, tool_name):
+        """Start or stop a tool depending on its current state"""
+        if self.controller.running_tools.get(tool_name):
+            self.stop_tool(tool_name)
+        else:
+            self.start_tool(tool_name)
+    
     def start_tool(self, tool_name):
         """Start a specific tool"""
         self.controller.launch_tool(tool_name)
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Started {tool_name}")
+        self._log(f"Started {tool_name}")
     
     def stop_tool(self, tool_name):
         """Stop a specific tool"""
         self.controller.stop_tool(tool_name)
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Stopped {tool_name}")
+        self._log(f"Stopped {tool_name}")
     
     def launch_all_tools(self):
         """Launch all tools"""
         self.controller.launch_all_tools()
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Launched all tools")
+        self._log("Launched all tools")
     
     def stop_all_tools(self):
         """Stop all tools"""
         self.controller.stop_all_tools()
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Stopped all tools")
+        self._log("Stopped all tools")
     
     def toggle_auto_captcha(self, enabled):
         """Toggle auto-CAPTCHA solving"""
-        self.controller.automation_rules['auto_captcha'] = enabled
-        self.controller.save_config()
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Auto-CAPTCHA: {'ON' if enabled else 'OFF'}")
+        self.controller.set_rule('auto_captcha', enabled)
+        self._save_timer.start(500)
+        self._log(f"Auto-CAPTCHA: {'ON' if enabled else 'OFF'}")
     
     def toggle_auto_session(self, enabled):
         """Toggle auto-session management"""
-        self.controller.automation_rules['auto_session'] = enabled
-        self.controller.save_config()
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Auto-session: {'ON' if enabled else 'OFF'}")
+        self.controller.set_rule('auto_session', enabled)
+        self._save_timer.start(500)
+        self._log(f"Auto-session: {'ON' if enabled else 'OFF'}")
     
     def toggle_auto_launch(self, enabled):
         """Toggle auto-launch on browser connect"""
         self.controller.config['auto_launch']['on_browser_connect'] = enabled
-        self.controller.save_config()
-        self.log_text.append(f"[{datetime.now().strftime('%H:%M:%S')}] Auto-launch: {'ON' if enabled else 'OFF'}")
+        self._save_timer.start(500)
+        self._log(f"Auto-launch: {'ON' if enabled else 'OFF'}")
+    
+    def _flush_save(self):
+        """Serialize on the UI thread, write on the save thread"""
+        data = self.controller.dump_config()
+        self._save_pool.start(SaveTask(self.controller, data))
+    
+    def closeEvent(self, event):
+        """Write any pending config change before closing"""
+        self._save_pool.waitForDone()
+        if self._save_timer.isActive():
+            self._save_timer.stop()
+            self.controller.save_config()
+        self.controller.close_session_manager()
+        event.accept()
 
 def main():
     """Entry point"""
@@ -688,6 +1140,7 @@ def main():
     
     # Start GUI
     app = QApplication(sys.argv)
+    app.setStyleSheet(_STYLESHEET)
     gui = AutomationGUI(controller)
     gui.show()
     
@@ -6,14 +6,70 @@
 
 import os
 import sys
+import copy
 import json
 import time
+import shlex
 import signal
+import selectors
 import subprocess
 import threading
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Seconds between system health checks
+HEALTH_CHECK_INTERVAL = 30
+
+# Bytes of each service's stderr kept for its exit report
+STDERR_KEEP_BYTES = 4096
+
+# Android shared storage as seen from Termux
+PHONE_STORAGE_PATH = "/storage/emulated/0"
+
+# Bumped whenever default_config gains top-level keys
+SCHEMA_VERSION = 2
+
+# Buffered log entries are written out once this many have queued up
+LOG_FLUSH_ENTRIES = 32
+
+# ...or once the oldest buffered entry is this many seconds old
+LOG_FLUSH_SECONDS = 5
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_dumps(obj, pretty=False):
+    """Serialize to UTF-8 JSON bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+    return json.dumps(obj, indent=2 if pretty else None).encode('utf-8')
+
+# Directories already known to exist in this process
+_ensured_dirs = set()
+
+# Parsed JSON files keyed by path, with the (mtime_ns, size) they were read at
+_JSON_CACHE = {}
+
+def _load_json_cached(path):
+    """Parse a JSON file, reusing the last result while the file is unchanged"""
+    st = os.stat(path)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    
+    data = _json_loads(Path(path).read_bytes())
+    _JSON_CACHE[path] = (stamp, data)
+    return data
+
 class TurboXCoreManager:
     """Central manager for TurboX Desktop OS services"""
     
@@ -22,39 +78,100 @@ class TurboXCoreManager:
         self.config_dir = os.path.join(self.home_dir, '.turboX')
         self.config_file = os.path.join(self.config_dir, 'config', 'system.json')
         
+        # Derived paths, joined once
+        self._desktop_dir = os.path.join(self.home_dir, 'Desktop')
+        self._docs_dir = os.path.join(self.home_dir, 'Documents')
+        self._downloads_dir = os.path.join(self.home_dir, 'Downloads')
+        self._logs_dir = os.path.join(self.config_dir, 'logs')
+        self._system_log_path = os.path.join(self._logs_dir, 'system.log')
+        self._phone_mount_point = os.path.join(self.home_dir, 'PhoneStorage')
+        self._phone_link_path = os.path.join(self._desktop_dir, 'Phone')
+        
         # Ensure directories exist
         self._ensure_directories()
         
         # Load or create config
+        self._config_dirty = False
         self.config = self._load_config()
         
+        # System log, kept open and written in batches
+        self._log_fd = os.open(
+            self._system_log_path,
+            os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600
+        )
+        self._log_buf = []
+        self._log_buf_since = 0
+        self._log_lock = threading.Lock()
+        
         # Service tracking
         self.services = {}
         self.running = True
         
-        # Setup signal handlers
-        signal.signal(signal.SIGINT, self.shutdown)
-        signal.signal(signal.SIGTERM, self.shutdown)
+        # Whether phone storage exists, checked once on first use
+        self._storage_available = None
+        
+        # The run loop waits on one selector: every service's stderr plus a
+        # pipe the C signal layer writes signal numbers into. Handlers are
+        # no-ops so SIGINT/SIGTERM/SIGCHLD are all dispatched from the loop.
+        self._service_pids = {}
+        self._selector = selectors.DefaultSelector()
+        self._wakeup_fd, wakeup_write_fd = os.pipe()
+        os.set_blocking(self._wakeup_fd, False)
+        os.set_blocking(wakeup_write_fd, False)
+        signal.set_wakeup_fd(wakeup_write_fd)
+        for sig in (signal.SIGINT, signal.SIGTERM, signal.SIGCHLD):
+            signal.signal(sig, lambda signum, frame: None)
+        self._selector.register(self._wakeup_fd, selectors.EVENT_READ)
     
     def _ensure_directories(self):
         """Create necessary directories if they don't exist"""
-        dirs = [
-            self.config_dir,
-            os.path.join(self.config_dir, 'config'),
-            os.path.join(self.config_dir, 'scripts'),
-            os.path.join(self.config_dir, 'tools'),
-            os.path.join(self.config_dir, 'logs'),
-            os.path.join(self.home_dir, 'Desktop'),
-            os.path.join(self.home_dir, 'Documents'),
-            os.path.join(self.home_dir, 'Downloads'),
+        # Expected children per parent; one scandir per parent tells us which
+        # already exist, instead of a stat or mkdir per directory
+        layout = [
+            (self.home_dir, ('.turboX', 'Desktop', 'Documents', 'Downloads')),
+            (self.config_dir, ('config', 'scripts', 'tools', 'logs')),
         ]
         
-        for dir_path in dirs:
-            os.makedirs(dir_path, exist_ok=True)
+        for parent, children in layout:
+            paths = [os.path.join(parent, name) for name in children]
+            if _ensured_dirs.issuperset(paths):
+                continue
+            
+            with os.scandir(parent) as entries:
+                existing = {entry.name for entry in entries if entry.is_dir()}
+            
+            for name, dir_path in zip(children, paths):
+                if name not in existing:
+                    os.makedirs(dir_path, exist_ok=True)
+                _ensured_dirs.add(dir_path)
     
     def _load_config(self):
         """Load or create system configuration"""
-        default_config = {
+        try:
+            # The cache's stat doubles as the existence check
+            config = copy.deepcopy(_load_json_cached(self.config_file))
+        except FileNotFoundError:
+            return self._default_config()
+        except Exception as e:
+            print(f"⚠️  Config load error: {e}, using defaults")
+            return self._default_config()
+        
+        # A file written at the current schema already has every default key
+        if config.get("schema_version") == SCHEMA_VERSION:
+            return config
+        
+        # Merge with defaults for any missing keys, then persist the upgrade
+        for key, value in self._default_config().items():
+            if key not in config:
+                config[key] = value
+        config["schema_version"] = SCHEMA_VERSION
+        self._config_dirty = True
+        return config
+    
+    def _default_config(self):
+        """Build the default system configuration"""
+        return {
+            "schema_version": SCHEMA_VERSION,
             "system": {
                 "version": "1.0.0",
                 "phase": 1,
@@ -74,63 +191,58 @@ class TurboXCoreManager:
             "storage": {
                 "phone_storage_mounted": False,
                 "sync_enabled": True,
-                "download_path": os.path.join(self.home_dir, 'Downloads')
+                "download_path": self._downloads_dir
             }
         }
-        
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                # Merge with defaults for any missing keys
-                for key, value in default_config.items():
-                    if key not in config:
-                        config[key] = value
-                return config
-            else:
-                return default_config
-        except Exception as e:
-            print(f"⚠️  Config load error: {e}, using defaults")
-            return default_config
     
     def save_config(self):
         """Save current configuration to file"""
         self.config['system']['last_save'] = datetime.now().isoformat()
         try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            # Write aside and rename over, so a crash never leaves half a file
+            tmp_file = self.config_file + ".tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(self.config, pretty=True))
+            os.replace(tmp_file, self.config_file)
+            self._config_dirty = False
             print("✅ Configuration saved")
         except Exception as e:
             print(f"❌ Config save error: {e}")
     
+    def mark_config_dirty(self):
+        """Queue a config save for the run loop's next pass"""
+        self._config_dirty = True
+    
     def start_service(self, service_name, command):
         """Start a system service"""
         if service_name in self.services:
             print(f"⚠️  Service '{service_name}' already running")
             return False
         
+        # Tokenize once here rather than paying for /bin/sh on every start
+        argv = shlex.split(command) if isinstance(command, str) else list(command)
+        
         try:
             process = subprocess.Popen(
-                command,
-                shell=True,
-                stdout=subprocess.PIPE,
+                argv,
+                stdout=subprocess.DEVNULL,
                 stderr=subprocess.PIPE,
-                text=True
+                close_fds=True,
+                start_new_session=True
             )
             
             self.services[service_name] = {
                 'process': process,
                 'command': command,
-                'started': datetime.now().isoformat()
+                'argv': argv,
+                'started': datetime.now().isoformat(),
+                'stderr': bytearray()
             }
+            self._service_pids[process.pid] = service_name
             
-            # Start monitor thread
-            monitor_thread = threading.Thread(
-                target=self._monitor_service,
-                args=(service_name, process),
-                daemon=True
-            )
-            monitor_thread.start()
+            # Hand stderr to the run loop
+            os.set_blocking(process.stderr.fileno(), False)
+            self._selector.register(process.stderr, selectors.EVENT_READ, data=service_name)
             
             print(f"✅ Started service: {service_name}")
             return True
@@ -139,18 +251,69 @@ class TurboXCoreManager:
             print(f"❌ Failed to start service '{service_name}': {e}")
             return False
     
-    def _monitor_service(self, service_name, process):
-        """Monitor a service process"""
-        stdout, stderr = process.communicate()
-        
-        if process.returncode != 0 and self.running:
-            print(f"⚠️  Service '{service_name}' exited with code {process.returncode}")
-            if stderr:
-                print(f"   Error: {stderr[:200]}")
-        
-        # Clean up
-        if service_name in self.services:
-            del self.services[service_name]
+    def _drain_wakeup(self):
+        """Empty the signal wakeup pipe, returning the signals it carried"""
+        signals = set()
+        try:
+            while True:
+                data = os.read(self._wakeup_fd, 512)
+                if not data:
+                    break
+                signals.update(data)
+        except BlockingIOError:
+            pass
+        return signals
+    
+    def _read_stderr(self, pipe, service_name):
+        """Read whatever a service has written to stderr, closing on EOF"""
+        while True:
+            try:
+                data = os.read(pipe.fileno(), 65536)
+            except BlockingIOError:
+                return
+            
+            if not data:
+                self._selector.unregister(pipe)
+                pipe.close()
+                return
+            
+            service = self.services.get(service_name)
+            if service is not None:
+                buf = service['stderr']
+                buf += data
+                del buf[:-STDERR_KEEP_BYTES]
+    
+    def _reap_children(self):
+        """Reap every exited child and clean up the matching services"""
+        while True:
+            try:
+                info = os.waitid(os.P_ALL, 0, os.WEXITED | os.WNOHANG)
+            except ChildProcessError:
+                return
+            if info is None:
+                return
+            
+            service_name = self._service_pids.pop(info.si_pid, None)
+            service = self.services.get(service_name) if service_name else None
+            if service is None:
+                continue  # Already stopped by stop_service
+            
+            process = service['process']
+            if info.si_code == os.CLD_EXITED:
+                process.returncode = info.si_status
+            else:
+                process.returncode = -info.si_status
+            
+            # Pick up anything written just before exit
+            if not process.stderr.closed:
+                self._read_stderr(process.stderr, service_name)
+            self.services.pop(service_name, None)
+            
+            if process.returncode != 0 and self.running:
+                print(f"⚠️  Service '{service_name}' exited with code {process.returncode}")
+                stderr = service['stderr'].decode('utf-8', 'replace').strip()
+                if stderr:
+                    print(f"   Error: {stderr[-200:]}")
     
     def stop_service(self, service_name):
         """Stop a running service"""
@@ -158,20 +321,46 @@ class TurboXCoreManager:
             print(f"⚠️  Service '{service_name}' not found")
             return False
         
-        service = self.services[service_name]
-        try:
-            service['process'].terminate()
-            # Wait a bit then kill if needed
-            time.sleep(1)
-            if service['process'].poll() is None:
-                service['process'].kill()
-            
-            del self.services[service_name]
+        return self._stop_services([service_name])
+    
+    def _stop_services(self, service_names):
+        """Terminate services together and wait for them against one deadline"""
+        stopping = []
+        for service_name in service_names:
+            # Detach from the run loop first so the exit is not reported as a crash
+            process = self.services.pop(service_name)['process']
+            self._service_pids.pop(process.pid, None)
+            try:
+                # Each service leads its own session, so signal the whole group
+                self._signal_group(process, signal.SIGTERM)
+                stopping.append((service_name, process))
+            except Exception as e:
+                print(f"❌ Error stopping service '{service_name}': {e}")
+        
+        # Children exit concurrently, so shutdown costs the slowest one, not the sum
+        deadline = time.monotonic() + 1
+        stopped = True
+        for service_name, process in stopping:
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                self._signal_group(process, signal.SIGKILL)
+                try:
+                    process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    print(f"❌ Service '{service_name}' did not exit after SIGKILL")
+                    stopped = False
+                    continue
             print(f"✅ Stopped service: {service_name}")
-            return True
-        except Exception as e:
-            print(f"❌ Error stopping service '{service_name}': {e}")
-            return False
+        
+        return stopped and len(stopping) == len(service_names)
+    
+    def _signal_group(self, process, sig):
+        """Send a signal to a service's process group"""
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            pass  # Already gone
     
     def check_system_health(self):
         """Check system health and report status"""
@@ -183,53 +372,66 @@ class TurboXCoreManager:
             "errors": []
         }
         
-        # Check X11 server
-        try:
-            result = subprocess.run(
-                ["pgrep", "-x", "termux-x11"],
-                capture_output=True,
-                text=True
-            )
-            health["x11_running"] = result.returncode == 0
-        except Exception as e:
-            health["errors"].append(f"X11 check failed: {e}")
-        
-        # Check window manager
+        # Find X11 and the window manager in one pass over /proc
+        wanted = {'termux-x11': 'x11_running', 'openbox': 'window_manager'}
         try:
-            result = subprocess.run(
-                ["pgrep", "-x", "openbox"],
-                capture_output=True,
-                text=True
-            )
-            health["window_manager"] = result.returncode == 0
-        except Exception as e:
-            health["errors"].append(f"WM check failed: {e}")
+            found = self._find_processes(wanted)
+            for name, key in wanted.items():
+                health[key] = name in found
+        except OSError as e:
+            health["errors"].append(f"Process check failed: {e}")
         
-        # Check storage mount
-        storage_path = "/storage/emulated/0"
-        health["storage_mounted"] = os.path.exists(storage_path)
+        # Check storage mount - the phone storage path does not come and go
+        if self._storage_available is None:
+            self._storage_available = os.path.exists(PHONE_STORAGE_PATH)
+        health["storage_mounted"] = self._storage_available
         
         return health
     
+    def _find_processes(self, names):
+        """Return which of the given process names are running"""
+        found = set()
+        with os.scandir('/proc') as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/comm") as f:
+                        comm = f.read().strip()
+                except OSError:
+                    continue  # Process exited while scanning
+                
+                if comm in names:
+                    found.add(comm)
+                    if len(found) == len(names):
+                        break
+        return found
+    
     def mount_phone_storage(self):
         """Mount phone storage to desktop"""
-        storage_path = "/storage/emulated/0"
-        mount_point = os.path.join(self.home_dir, "PhoneStorage")
+        storage_path = PHONE_STORAGE_PATH
+        mount_point = self._phone_mount_point
         
-        if not os.path.exists(storage_path):
+        if self._storage_available is None:
+            self._storage_available = os.path.exists(storage_path)
+        if not self._storage_available:
             print("❌ Phone storage not accessible")
             return False
         
         try:
             os.makedirs(mount_point, exist_ok=True)
-            # Create symlink for easy access
-            link_path = os.path.join(self.home_dir, "Desktop", "Phone")
-            if os.path.exists(link_path):
-                os.remove(link_path)
-            os.symlink(mount_point, link_path)
+            # Create symlink for easy access - build it aside, then swap it in
+            link_path = self._phone_link_path
+            tmp_link = link_path + ".tmp"
+            try:
+                os.unlink(tmp_link)
+            except FileNotFoundError:
+                pass
+            os.symlink(mount_point, tmp_link)
+            os.replace(tmp_link, link_path)
             
             self.config['storage']['phone_storage_mounted'] = True
-            self.save_config()
+            self.mark_config_dirty()
             
             print(f"✅ Phone storage mounted at: {link_path}")
             return True
@@ -239,16 +441,33 @@ class TurboXCoreManager:
     
     def log_system_event(self, event_type, message):
         """Log system events"""
-        log_file = os.path.join(self.config_dir, 'logs', 'system.log')
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
         log_entry = f"[{timestamp}] [{event_type}] {message}\n"
         
+        with self._log_lock:
+            if not self._log_buf:
+                self._log_buf_since = time.monotonic()
+            self._log_buf.append(log_entry.encode('utf-8'))
+            
+            if (len(self._log_buf) >= LOG_FLUSH_ENTRIES or
+                    time.monotonic() - self._log_buf_since > LOG_FLUSH_SECONDS):
+                self._flush_log_locked()
+    
+    def flush_log(self):
+        """Write any buffered log entries"""
+        with self._log_lock:
+            self._flush_log_locked()
+    
+    def _flush_log_locked(self):
+        """Write buffered log entries in one call; caller holds _log_lock"""
+        if not self._log_buf:
+            return
         try:
-            with open(log_file, 'a') as f:
-                f.write(log_entry)
-        except Exception:
+            os.writev(self._log_fd, self._log_buf)
+        except OSError:
             pass  # Don't crash if logging fails
+        self._log_buf.clear()
     
     def shutdown(self, signum=None, frame=None):
         """Graceful shutdown of all services"""
@@ -256,10 +475,11 @@ class TurboXCoreManager:
         self.running = False
         
         # Stop all services
-        for service_name in list(self.services.keys()):
-            self.stop_service(service_name)
+        self._stop_services(list(self.services))
         
         self.save_config()
+        self.flush_log()
+        os.close(self._log_fd)
         print("✅ TurboX shutdown complete")
         sys.exit(0)
     
@@ -280,28 +500,36 @@ class TurboXCoreManager:
             print("🔧 Attempting to mount phone storage...")
             self.mount_phone_storage()
         
-        # Main monitoring loop
-        last_health_check = 0
+        # Main event loop - sleeps until a signal, service output, or the
+        # next health check is due
+        next_health_check = time.monotonic()
         while self.running:
             try:
-                current_time = time.time()
+                timeout = max(0.0, next_health_check - time.monotonic())
+                for key, _ in self._selector.select(timeout):
+                    if key.fd == self._wakeup_fd:
+                        signals = self._drain_wakeup()
+                        if signals & {signal.SIGINT, signal.SIGTERM}:
+                            self.shutdown()
+                        if signal.SIGCHLD in signals:
+                            self._reap_children()
+                    else:
+                        self._read_stderr(key.fileobj, key.data)
                 
-                # Periodic health check every 30 seconds
-                if current_time - last_health_check > 30:
+                if time.monotonic() >= next_health_check:
                     health = self.check_system_health()
                     
                     if not health["x11_running"]:
                         print("⚠️  X11 server not detected")
                     
-                    last_health_check = current_time
-                
-                time.sleep(5)  # Main loop sleep
+                    # Don't let quiet periods hold log entries or config changes back
+                    self.flush_log()
+                    if self._config_dirty:
+                        self.save_config()
+                    next_health_check = time.monotonic() + HEALTH_CHECK_INTERVAL
                 
-            except KeyboardInterrupt:
-                self.shutdown()
             except Exception as e:
                 print(f"❌ Main loop error: {e}")
-                time.sleep(10)
 
 def main():
     """Entry point"""
@@ -6,14 +6,36 @@
 
 import os
 import sys
+import copy
 import json
+import time
 import subprocess
 import threading
 from datetime import datetime
+from functools import lru_cache
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 
+# Desktop configuration used when system.json is missing or unreadable
+DEFAULT_DESKTOP_CONFIG = {
+    'desktop': {
+        'theme': 'windows-dark',
+        'taskbar': True,
+        'start_menu': True
+    }
+}
+
+@lru_cache(maxsize=4)
+def _load_config_cached(path, mtime_ns):
+    """Parse a config file; keying on mtime makes edits miss the cache"""
+    with open(path, 'rb') as f:
+        return json.load(f)
+
+def invalidate_config_cache():
+    """Forget parsed config files, e.g. after writing one"""
+    _load_config_cached.cache_clear()
+
 class WindowsDesktop(QMainWindow):
     """Windows-style desktop environment with full mouse control"""
     
@@ -25,6 +47,10 @@ class WindowsDesktop(QMainWindow):
         # Load configuration
         self.config = self.load_config()
         
+        # Start menu and settings dialog, built on first open
+        self.start_menu = None
+        self.settings_dialog = None
+        
         # Window tracking
         self.windows = []
         self.active_window = None
@@ -49,16 +75,11 @@ class WindowsDesktop(QMainWindow):
         """Load desktop configuration"""
         config_file = os.path.join(self.config_dir, 'config', 'system.json')
         try:
-            with open(config_file, 'r') as f:
-                return json.load(f)
-        except:
-            return {
-                'desktop': {
-                    'theme': 'windows-dark',
-                    'taskbar': True,
-                    'start_menu': True
-                }
-            }
+            mtime_ns = os.stat(config_file).st_mtime_ns
+            # Copied so settings changes never write into the cached dict
+            return copy.deepcopy(_load_config_cached(config_file, mtime_ns))
+        except (OSError, ValueError):
+            return copy.deepcopy(DEFAULT_DESKTOP_CONFIG)
     
     def init_windows_ui(self):
         """Initialize Windows-style user interface"""
@@ -75,7 +96,7 @@ class WindowsDesktop(QMainWindow):
         # Set window flags for desktop
         self.setWindowFlags(Qt.FramelessWindowHint | Qt.WindowStaysOnBottomHint)
         
-        # Set background (wallpaper)
+        # Set background: a plain fill until change_wallpaper sets an image
         self.setStyleSheet(self.get_windows_stylesheet())
         
         # Create desktop widgets
@@ -94,10 +115,6 @@ class WindowsDesktop(QMainWindow):
         return """
         QMainWindow {
             background-color: #1e1e1e;
-            background-image: url('');
-            background-repeat: no-repeat;
-            background-position: center;
-            background-size: cover;
         }
         QWidget {
             font-family: 'Segoe UI', Arial, sans-serif;
@@ -110,6 +127,23 @@ class WindowsDesktop(QMainWindow):
         self.desktop_widget = QWidget(self)
         self.desktop_widget.setGeometry(20, 20, 800, 600)
         
+        # One rule for every icon instead of a stylesheet per button
+        self.desktop_widget.setStyleSheet("""
+            QPushButton#desktopIcon {
+                background: transparent;
+                border: none;
+                color: white;
+                font-size: 12px;
+                padding: 5px;
+                text-align: center;
+            }
+            QPushButton#desktopIcon:hover {
+                background-color: rgba(255, 255, 255, 0.1);
+                border: 1px solid rgba(255, 255, 255, 0.3);
+                border-radius: 5px;
+            }
+        """)
+        
         # Desktop icons layout
         icons_layout = QVBoxLayout(self.desktop_widget)
         
@@ -146,21 +180,8 @@ class WindowsDesktop(QMainWindow):
         icon_btn.setIcon(self.get_icon(icon_type))
         icon_btn.setIconSize(QSize(48, 48))
         icon_btn.setFixedSize(100, 100)
-        icon_btn.setStyleSheet("""
-            QPushButton {
-                background: transparent;
-                border: none;
-                color: white;
-                font-size: 12px;
-                padding: 5px;
-                text-align: center;
-            }
-            QPushButton:hover {
-                background-color: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.3);
-                border-radius: 5px;
-            }
-        """)
+        # Styled by the container's shared desktopIcon rule
+        icon_btn.setObjectName("desktopIcon")
         icon_btn.clicked.connect(click_handler)
         return icon_btn
     
@@ -230,12 +251,28 @@ class WindowsDesktop(QMainWindow):
         """)
         start_btn.clicked.connect(self.show_start_menu)
         taskbar_layout.addWidget(start_btn)
+        self.start_btn = start_btn
         
         # Taskbar applications
         self.taskbar_apps = QWidget()
         apps_layout = QHBoxLayout(self.taskbar_apps)
         apps_layout.setContentsMargins(10, 0, 10, 0)
         
+        # One rule for every taskbar app button instead of a stylesheet each
+        self.taskbar_apps.setStyleSheet("""
+            QPushButton {
+                background: transparent;
+                border: none;
+                border-radius: 5px;
+            }
+            QPushButton:hover {
+                background-color: rgba(255, 255, 255, 0.1);
+            }
+            QPushButton:pressed {
+                background-color: rgba(255, 255, 255, 0.2);
+            }
+        """)
+        
         # Add common apps
         apps = [
             ("File Manager", "system-file-manager", self.open_file_manager),
@@ -251,19 +288,6 @@ class WindowsDesktop(QMainWindow):
             app_btn.setIconSize(QSize(24, 24))
             app_btn.setFixedSize(36, 36)
             app_btn.setToolTip(app_name)
-            app_btn.setStyleSheet("""
-                QPushButton {
-                    background: transparent;
-                    border: none;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: rgba(255, 255, 255, 0.1);
-                }
-                QPushButton:pressed {
-                    background-color: rgba(255, 255, 255, 0.2);
-                }
-            """)
             app_btn.clicked.connect(app_handler)
             apps_layout.addWidget(app_btn)
         
@@ -279,6 +303,8 @@ class WindowsDesktop(QMainWindow):
         tray_layout.addWidget(self.clock_label)
         
         # Update clock
+        self._clock_text = None
+        self._clock_next_minute = 0
         self.update_clock()
         self.clock_timer = QTimer()
         self.clock_timer.timeout.connect(self.update_clock)
@@ -288,14 +314,32 @@ class WindowsDesktop(QMainWindow):
     
     def update_clock(self):
         """Update taskbar clock"""
-        current_time = datetime.now().strftime("%I:%M %p")
-        current_date = datetime.now().strftime("%d/%m")
-        self.clock_label.setText(f"{current_time} | {current_date}")
+        # The text only changes once a minute; ticks before the next minute
+        # boundary cost one float compare instead of a strftime
+        now = time.time()
+        if now < self._clock_next_minute:
+            return
+        self._clock_next_minute = (int(now) // 60 + 1) * 60
+        
+        text = datetime.fromtimestamp(now).strftime("%I:%M %p | %d/%m")
+        if text != self._clock_text:
+            self._clock_text = text
+            self.clock_label.setText(text)
     
     def show_start_menu(self):
         """Show Windows-style start menu"""
-        self.start_menu = QMenu(self)
-        self.start_menu.setStyleSheet("""
+        # Built on first open and reused - rebuilding leaked a QMenu per click
+        if self.start_menu is None:
+            self.start_menu = self._build_start_menu()
+        
+        # Show menu at start button position
+        pos = self.start_btn.mapToGlobal(QPoint(0, self.start_btn.height()))
+        self.start_menu.exec_(pos)
+    
+    def _build_start_menu(self):
+        """Create the start menu and its actions"""
+        start_menu = QMenu(self)
+        start_menu.setStyleSheet("""
             QMenu {
                 background-color: #2d2d2d;
                 border: 1px solid #555;
@@ -318,7 +362,7 @@ class WindowsDesktop(QMainWindow):
         """)
         
         # Add menu items
-        apps_menu = self.start_menu.addMenu("📁 Applications")
+        apps_menu = start_menu.addMenu("📁 Applications")
         
         # System apps
         apps_menu.addAction("📂 File Manager", self.open_file_manager)
@@ -332,45 +376,50 @@ class WindowsDesktop(QMainWindow):
         apps_menu.addAction("📱 SMS Panel", self.open_sms_panel)
         apps_menu.addAction("🤖 Automation", self.open_automation)
         
-        self.start_menu.addSeparator()
+        start_menu.addSeparator()
         
         # System
-        self.start_menu.addAction("⚙️ Settings", self.open_settings)
-        self.start_menu.addAction("🔄 Restart Desktop", self.restart_desktop)
-        self.start_menu.addAction("⏹️ Shutdown", self.shutdown)
+        start_menu.addAction("⚙️ Settings", self.open_settings)
+        start_menu.addAction("🔄 Restart Desktop", self.restart_desktop)
+        start_menu.addAction("⏹️ Shutdown", self.shutdown)
         
-        # Show menu at start button position
-        start_btn = self.taskbar.findChild(QPushButton)
-        if start_btn:
-            pos = start_btn.mapToGlobal(QPoint(0, start_btn.height()))
-            self.start_menu.exec_(pos)
+        return start_menu
+    
+    def launch_app(self, argv):
+        """Start a detached program, reporting a missing binary instead of raising"""
+        # An exception escaping a Qt slot aborts PyQt5, taking the desktop down
+        try:
+            return subprocess.Popen(argv)
+        except OSError as e:
+            print(f"❌ Failed to launch {argv[0]}: {e}")
+            return None
     
     def open_file_manager(self):
         """Open file manager"""
-        subprocess.Popen(['pcmanfm'])
+        self.launch_app(['pcmanfm'])
     
     def open_terminal(self):
         """Open terminal"""
-        subprocess.Popen(['xfce4-terminal'])
+        self.launch_app(['xfce4-terminal'])
     
     def open_browser(self):
         """Open web browser"""
-        subprocess.Popen(['firefox'])
+        self.launch_app(['firefox'])
     
     def open_api_tester(self):
         """Open API Tester"""
         api_path = os.path.join(self.config_dir, 'tools', 'api_tester_auto.py')
-        subprocess.Popen([sys.executable, api_path])
+        self.launch_app([sys.executable, api_path])
     
     def open_sms_panel(self):
         """Open SMS Panel"""
         sms_path = os.path.join(self.config_dir, 'tools', 'sms_panel_auto.py')
-        subprocess.Popen([sys.executable, sms_path])
+        self.launch_app([sys.executable, sms_path])
     
     def open_automation(self):
         """Open Automation Controller"""
         auto_path = os.path.join(self.config_dir, 'scripts', 'automation_controller.py')
-        subprocess.Popen([sys.executable, auto_path])
+        self.launch_app([sys.executable, auto_path])
     
     def open_turbox_launcher(self):
         """Open TurboX application launcher"""
@@ -379,7 +428,7 @@ class WindowsDesktop(QMainWindow):
     def open_folder(self, folder_name):
         """Open specific folder"""
         folder_path = os.path.join(self.home_dir, folder_name)
-        subprocess.Popen(['pcmanfm', folder_path])
+        self.launch_app(['pcmanfm', folder_path])
     
     def open_recycle_bin(self):
         """Open recycle bin"""
@@ -388,6 +437,19 @@ class WindowsDesktop(QMainWindow):
     
     def open_settings(self):
         """Open settings dialog"""
+        # Built once and reused; only the current values are refreshed per open
+        if self.settings_dialog is None:
+            self.settings_dialog = self._build_settings_dialog()
+        
+        desktop = self.config.get('desktop', {})
+        self.settings_theme_combo.setCurrentText(desktop.get('theme', 'Windows Dark').replace('-', ' ').title())
+        self.settings_taskbar_check.setChecked(desktop.get('taskbar', True))
+        self.settings_autostart_check.setChecked(self.config.get('system', {}).get('auto_start', True))
+        
+        self.settings_dialog.exec_()
+    
+    def _build_settings_dialog(self):
+        """Create the settings dialog and its controls"""
         settings_dialog = QDialog(self)
         settings_dialog.setWindowTitle("TurboX Settings")
         settings_dialog.setFixedSize(400, 300)
@@ -396,35 +458,32 @@ class WindowsDesktop(QMainWindow):
         
         # Theme selection
         theme_label = QLabel("Theme:")
-        theme_combo = QComboBox()
-        theme_combo.addItems(["Windows Dark", "Windows Light", "Classic"])
-        theme_combo.setCurrentText(self.config.get('desktop', {}).get('theme', 'Windows Dark').replace('-', ' ').title())
+        self.settings_theme_combo = QComboBox()
+        self.settings_theme_combo.addItems(["Windows Dark", "Windows Light", "Classic"])
         
         # Taskbar toggle
-        taskbar_check = QCheckBox("Show taskbar")
-        taskbar_check.setChecked(self.config.get('desktop', {}).get('taskbar', True))
+        self.settings_taskbar_check = QCheckBox("Show taskbar")
         
         # Auto-start toggle
-        autostart_check = QCheckBox("Start on boot")
-        autostart_check.setChecked(self.config.get('system', {}).get('auto_start', True))
+        self.settings_autostart_check = QCheckBox("Start on boot")
         
         # Apply button
         apply_btn = QPushButton("Apply")
         apply_btn.clicked.connect(lambda: self.apply_settings(
-            theme_combo.currentText(),
-            taskbar_check.isChecked(),
-            autostart_check.isChecked(),
+            self.settings_theme_combo.currentText(),
+            self.settings_taskbar_check.isChecked(),
+            self.settings_autostart_check.isChecked(),
             settings_dialog
         ))
         
         layout.addWidget(theme_label)
-        layout.addWidget(theme_combo)
-        layout.addWidget(taskbar_check)
-        layout.addWidget(autostart_check)
+        layout.addWidget(self.settings_theme_combo)
+        layout.addWidget(self.settings_taskbar_check)
+        layout.addWidget(self.settings_autostart_check)
         layout.addWidget(apply_btn)
         
         settings_dialog.setLayout(layout)
-        settings_dialog.exec_()
+        return settings_dialog
     
     def apply_settings(self, theme, taskbar, autostart, dialog):
         """Apply desktop settings"""
@@ -437,6 +496,7 @@ class WindowsDesktop(QMainWindow):
         config_file = os.path.join(self.config_dir, 'config', 'system.json')
         with open(config_file, 'w') as f:
             json.dump(self.config, f, indent=2)
+        invalidate_config_cache()
         
         # Update autostart
         autostart_file = os.path.join(self.config_dir, 'config', 'autostart')
@@ -454,7 +514,6 @@ class WindowsDesktop(QMainWindow):
                                    QMessageBox.Yes | QMessageBox.No)
         if reply == QMessageBox.Yes:
             subprocess.Popen(['turbox', 'stop'])
-            import time
             time.sleep(2)
             subprocess.Popen(['turbox', 'start'])
     
@@ -499,7 +558,7 @@ class WindowsDesktop(QMainWindow):
     def start_service(self, script_name):
         """Start a background service"""
         script_path = os.path.join(self.config_dir, 'scripts', script_name)
-        subprocess.Popen([sys.executable, script_path])
+        self.launch_app([sys.executable, script_path])
     
     # Mouse event handling for full mouse control
     def eventFilter(self, obj, event):
@@ -653,22 +712,24 @@ class WindowsDesktop(QMainWindow):
     
     def update_cursor(self, position):
         """Update cursor based on position"""
+        shape = Qt.ArrowCursor
+        
         # Check if near window edge for resizing
         for window in self.windows:
-            if window.geometry().contains(position):
+            geom = window.geometry()
+            if geom.contains(position):
                 # Check edges
-                geom = window.geometry()
                 if (abs(position.x() - geom.left()) < 5 or
                     abs(position.x() - geom.right()) < 5):
-                    self.setCursor(Qt.SizeHorCursor)
+                    shape = Qt.SizeHorCursor
                 elif (abs(position.y() - geom.top()) < 5 or
                       abs(position.y() - geom.bottom()) < 5):
-                    self.setCursor(Qt.SizeVerCursor)
-                else:
-                    self.setCursor(Qt.ArrowCursor)
-                return
+                    shape = Qt.SizeVerCursor
+                break
         
-        self.setCursor(Qt.ArrowCursor)
+        # Mouse moves arrive far faster than the shape changes
+        if self.cursor().shape() != shape:
+            self.setCursor(shape)
     
     def create_window(self, title, content_widget, width=800, height=600):
         """Create a new resizable window"""
@@ -709,6 +770,21 @@ class WindowsDesktop(QMainWindow):
         controls.setGeometry(width - 90, 0, 90, 30)
         controls_layout = QHBoxLayout(controls)
         controls_layout.setContentsMargins(0, 0, 5, 0)
+        controls.setStyleSheet("""
+            QPushButton {
+                background-color: #4d4d4d;
+                color: white;
+                border: none;
+                border-radius: 3px;
+                font-weight: bold;
+            }
+            QPushButton:hover {
+                background-color: #5d5d5d;
+            }
+            QPushButton:pressed {
+                background-color: #3d3d3d;
+            }
+        """)
         
         # Minimize button
         min_btn = QPushButton("─")
@@ -725,23 +801,6 @@ class WindowsDesktop(QMainWindow):
         close_btn.setFixedSize(20, 20)
         close_btn.clicked.connect(window.close)
         
-        for btn in [min_btn, max_btn, close_btn]:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #4d4d4d;
-                    color: white;
-                    border: none;
-                    border-radius: 3px;
-                    font-weight: bold;
-                }
-                QPushButton:hover {
-                    background-color: #5d5d5d;
-                }
-                QPushButton:pressed {
-                    background-color: #3d3d3d;
-                }
-            """)
-        
         controls_layout.addWidget(min_btn)
         controls_layout.addWidget(max_btn)
         controls_layout.addWidget(close_btn)
@@ -755,13 +814,25 @@ class WindowsDesktop(QMainWindow):
         # Make window draggable
         window.setWindowFlags(Qt.FramelessWindowHint)
         
-        # Add to windows list
+        # Add to windows list; closing deletes the window, and its destroyed
+        # signal drops it so the mouse handlers never walk dead windows
+        window.setAttribute(Qt.WA_DeleteOnClose)
+        window.destroyed.connect(lambda: self._forget_window(window))
         self.windows.append(window)
         self.active_window = window
         
         window.show()
         return window
     
+    def _forget_window(self, window):
+        """Drop a destroyed window from tracking"""
+        if window in self.windows:
+            self.windows.remove(window)
+        if self.active_window is window:
+            self.active_window = self.windows[-1] if self.windows else None
+        if self.mouse_state['drag_window'] is window:
+            self.mouse_state['drag_window'] = None
+    
     def toggle_maximize(self, window):
         """Toggle window maximize/restore"""
         if window.isMaximized():
@@ -5,15 +5,25 @@
 # ==============================================================================
 
 import os
+import re
 import sys
 import json
+import shlex
 import subprocess
 import threading
+from collections import deque
 from datetime import datetime
 from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 
+# Lines of app output kept for the exit report
+OUTPUT_TAIL_LINES = 20
+
+# Commands containing any of these need /bin/sh to interpret them; '=' covers
+# leading VAR=value assignments, braces and brackets cover expansion/globs
+_SHELL_META = re.compile(r'[|&;<>$`()*?!~#=\[\]{}\n]')
+
 class TurboXLauncher(QWidget):
     """Main desktop launcher and application manager"""
     
@@ -26,6 +36,13 @@ class TurboXLauncher(QWidget):
         # Load applications
         self.applications = self._load_applications()
         
+        # Flat app_id -> definition map so launches skip the category walk
+        self._app_index = {
+            app_id: app_info
+            for category in self.applications.values()
+            for app_id, app_info in category.items()
+        }
+        
         # Track running apps
         self.running_apps = {}
         
@@ -188,64 +205,28 @@ class TurboXLauncher(QWidget):
     
     def _create_app_button(self, app_id, app_info):
         """Create an application launch button"""
-        btn = QPushButton(app_info["name"])
+        # Label is settled up front so the button text is set only once
+        enabled = app_info.get("enabled", True)
+        label = app_info["name"] if enabled else f"{app_info['name']} (Phase 2)"
+        btn = QPushButton(label)
         btn.setToolTip(app_info["description"])
         btn.setMinimumHeight(50)
         
-        # Style based on category
-        if app_info["category"] == "system":
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #2b579a;
-                    color: white;
-                    border-radius: 5px;
-                    font-size: 14px;
-                    text-align: left;
-                    padding-left: 20px;
-                }
-                QPushButton:hover {
-                    background-color: #3a6bc5;
-                }
-                QPushButton:disabled {
-                    background-color: #666;
-                }
-            """)
-        else:
-            btn.setStyleSheet("""
-                QPushButton {
-                    background-color: #107c10;
-                    color: white;
-                    border-radius: 5px;
-                    font-size: 14px;
-                    text-align: left;
-                    padding-left: 20px;
-                }
-                QPushButton:hover {
-                    background-color: #1a9e1a;
-                }
-                QPushButton:disabled {
-                    background-color: #666;
-                }
-            """)
+        # Styled by the launcher's QPushButton[category=...] rules
+        btn.setProperty("category", app_info["category"])
         
         # Connect click event
         btn.clicked.connect(lambda checked, aid=app_id: self.launch_application(aid))
         
         # Disable if not enabled
-        if not app_info.get("enabled", True):
+        if not enabled:
             btn.setEnabled(False)
-            btn.setText(f"{app_info['name']} (Phase 2)")
         
         return btn
     
     def launch_application(self, app_id):
         """Launch an application"""
-        # Find the app in categories
-        app_info = None
-        for category in self.applications.values():
-            if app_id in category:
-                app_info = category[app_id]
-                break
+        app_info = self._app_index.get(app_id)
         
         if not app_info:
             self.status_label.setText(f"❌ Application '{app_id}' not found")
@@ -256,13 +237,16 @@ class TurboXLauncher(QWidget):
             return
         
         try:
-            # Run command in background
+            # Run command in background, skipping /bin/sh for plain commands
+            command = app_info["command"]
+            use_shell = bool(_SHELL_META.search(command))
             process = subprocess.Popen(
-                app_info["command"],
-                shell=True,
+                command if use_shell else shlex.split(command),
+                shell=use_shell,
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True
+                stderr=subprocess.STDOUT,
+                text=True,
+                bufsize=1
             )
             
             # Track running app
@@ -289,12 +273,16 @@ class TurboXLauncher(QWidget):
     
     def _monitor_app(self, app_id, process):
         """Monitor a running application"""
-        stdout, stderr = process.communicate()
+        # Drain output as it arrives, keeping only the tail for error reports
+        tail = deque(maxlen=OUTPUT_TAIL_LINES)
+        for line in process.stdout:
+            tail.append(line)
+        process.wait()
         
         if process.returncode != 0:
             print(f"⚠️  App '{app_id}' exited with code {process.returncode}")
-            if stderr:
-                print(f"   Error: {stderr[:200]}")
+            if tail:
+                print(f"   Error: {''.join(tail)[-200:]}")
         
         # Remove from running apps
         if app_id in self.running_apps:
@@ -347,6 +335,26 @@ class TurboXLauncher(QWidget):
             color: white;
             font-size: 12px;
         }
+        QPushButton[category] {
+            background-color: #107c10;
+            color: white;
+            border-radius: 5px;
+            font-size: 14px;
+            text-align: left;
+            padding-left: 20px;
+        }
+        QPushButton[category]:hover {
+            background-color: #1a9e1a;
+        }
+        QPushButton[category="system"] {
+            background-color: #2b579a;
+        }
+        QPushButton[category="system"]:hover {
+            background-color: #3a6bc5;
+        }
+        QPushButton[category]:disabled {
+            background-color: #666;
+        }
         """
     
     def closeEvent(self, event):
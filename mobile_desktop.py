@@ -24,6 +24,10 @@ class MobileDesktop(QMainWindow):
         self.setGeometry(0, 0, 800, 600)
         self.setWindowFlags(Qt.FramelessWindowHint)
         
+        # Loading popup, built on first use and hidden rather than destroyed
+        self.loading_box = None
+        self.loading_timer = None
+        
         # Create central widget
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
@@ -87,6 +91,18 @@ class MobileDesktop(QMainWindow):
             QWidget {
                 background-color: #ecf0f1;
             }
+            QLabel#toolIcon {
+                font-size: 24px;
+            }
+            QLabel#toolTitle {
+                font-size: 16px;
+                font-weight: bold;
+                color: #2c3e50;
+            }
+            QLabel#toolDesc {
+                font-size: 12px;
+                color: #7f8c8d;
+            }
         """)
         
         content_layout = QVBoxLayout(content_widget)
@@ -173,15 +189,15 @@ class MobileDesktop(QMainWindow):
         btn_layout = QVBoxLayout(btn)
         btn_layout.setContentsMargins(10, 10, 10, 10)
         
-        # Icon and title
+        # Icon and title, styled by the content area's QLabel#tool* rules
         title_layout = QHBoxLayout()
         
         icon_label = QLabel(icon)
-        icon_label.setStyleSheet("font-size: 24px;")
+        icon_label.setObjectName("toolIcon")
         title_layout.addWidget(icon_label)
         
         title_label = QLabel(title)
-        title_label.setStyleSheet("font-size: 16px; font-weight: bold; color: #2c3e50;")
+        title_label.setObjectName("toolTitle")
         title_layout.addWidget(title_label)
         title_layout.addStretch()
         
@@ -189,7 +205,7 @@ class MobileDesktop(QMainWindow):
         
         # Description
         desc_label = QLabel(desc)
-        desc_label.setStyleSheet("font-size: 12px; color: #7f8c8d;")
+        desc_label.setObjectName("toolDesc")
         desc_label.setWordWrap(True)
         btn_layout.addWidget(desc_label)
         
@@ -205,6 +221,19 @@ class MobileDesktop(QMainWindow):
                 background-color: #2c3e50;
                 border-top: 1px solid #34495e;
             }
+            QPushButton {
+                background-color: transparent;
+                color: #bdc3c7;
+                border: none;
+                font-size: 11px;
+                padding: 5px;
+            }
+            QPushButton:hover {
+                color: white;
+            }
+            QPushButton:pressed {
+                background-color: #34495e;
+            }
         """)
         
         nav_layout = QHBoxLayout(nav_widget)
@@ -222,21 +251,6 @@ class MobileDesktop(QMainWindow):
         
         for icon, text, handler in nav_items:
             nav_btn = QPushButton(f"{icon}\n{text}")
-            nav_btn.setStyleSheet("""
-                QPushButton {
-                    background-color: transparent;
-                    color: #bdc3c7;
-                    border: none;
-                    font-size: 11px;
-                    padding: 5px;
-                }
-                QPushButton:hover {
-                    color: white;
-                }
-                QPushButton:pressed {
-                    background-color: #34495e;
-                }
-            """)
             nav_btn.setFixedHeight(60)
             nav_btn.clicked.connect(handler)
             nav_layout.addWidget(nav_btn)
@@ -561,14 +575,20 @@ class MobileDesktop(QMainWindow):
     
     def show_loading(self, message):
         """Show loading message"""
-        loading = QMessageBox(self)
-        loading.setWindowTitle("Please wait")
-        loading.setText(message)
-        loading.setStandardButtons(QMessageBox.NoButton)
-        loading.show()
-        
-        # Close after 1 second
-        QTimer.singleShot(1000, loading.close)
+        if self.loading_box is None:
+            self.loading_box = QMessageBox(self)
+            self.loading_box.setWindowTitle("Please wait")
+            self.loading_box.setStandardButtons(QMessageBox.NoButton)
+            
+            self.loading_timer = QTimer(self)
+            self.loading_timer.setSingleShot(True)
+            self.loading_timer.timeout.connect(self.loading_box.hide)
+        
+        self.loading_box.setText(message)
+        self.loading_box.show()
+        
+        # Hide after 1 second; a repeat call restarts the countdown
+        self.loading_timer.start(1000)
     
     # Navigation functions
     def show_home(self):
@@ -5,15 +5,61 @@
 # ==============================================================================
 
 import os
+import re
+import atexit
 import sys
+import csv
 import json
+import base64
 import time
 import hashlib
 import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 import sqlite3
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Bounds on the expiry checker's sleep: it polls every minute while a
+# session is within the refresh window and backs off to hourly otherwise
+SESSION_CHECK_MIN_SECONDS = 60
+SESSION_CHECK_MAX_SECONDS = 3600
+
+# Seconds a session's last_used bump may wait before it is written
+LAST_USED_FLUSH_SECONDS = 2
+
+# JSON-encoded TEXT columns of the sessions table
+SESSION_JSON_FIELDS = ('cookies', 'tokens', 'headers', 'login_data', 'metadata')
+
+# JSON-encoded TEXT columns of the captured_requests table
+REQUEST_JSON_FIELDS = ('request_headers', 'response_headers')
+
+def _json_loads(data):
+    """Parse JSON from str or bytes, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _json_text(obj):
+    """Serialize to a JSON str for a TEXT column, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode('utf-8')
+    return json.dumps(obj)
+
+def _parse_json_fields(record, fields):
+    """Decode a row's JSON columns in place, falling back to {}"""
+    for field in fields:
+        if record[field]:
+            try:
+                record[field] = _json_loads(record[field])
+            except (TypeError, ValueError):
+                record[field] = {}
+    return record
+
 class SessionManager:
     """Central manager for all authentication sessions and tokens"""
     
@@ -25,6 +71,14 @@ class SessionManager:
             db_path = os.path.join(self.config_dir, 'sessions.db')
         
         self.db_path = db_path
+        
+        # One connection for the manager's lifetime, shared by the refresh
+        # thread and any proxy clients, so access goes through _db()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._db_lock = threading.RLock()
+        self._closed = False
         self._init_database()
         
         # Active sessions cache
@@ -34,15 +88,74 @@ class SessionManager:
         # CAPTCHA solutions cache
         self.captcha_cache = {}
         
-        # Auto-refresh thread
+        # last_used bumps from lookups, written together by flush_last_used()
+        self._pending_last_used = {}
+        self._flush_timer = None
+        
+        # Auto-refresh thread, woken early by close() or a session expiry change
+        self._stop_event = threading.Event()
+        self._wake_event = threading.Event()
         self.refresh_thread = threading.Thread(target=self._auto_refresh_sessions, daemon=True)
         self.refresh_thread.start()
+        
+        # Last resort for owners that exit without calling close()
+        atexit.register(self.close)
+    
+    @contextmanager
+    def _db(self):
+        """Hold the shared connection for one transaction"""
+        with self._db_lock, self._conn:
+            yield self._conn
+    
+    def close(self):
+        """Flush queued writes and close the database connection"""
+        self._stop_event.set()
+        self._wake_event.set()
+        with self._db_lock:
+            if self._closed:
+                return
+            self.flush_last_used()
+            self._conn.close()
+            self._closed = True
+        atexit.unregister(self.close)
+    
+    def _touch_session(self, session_id):
+        """Queue a last_used bump instead of writing it immediately"""
+        with self._db_lock:
+            if self._closed:
+                return
+            self._pending_last_used[session_id] = datetime.now().isoformat()
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(LAST_USED_FLUSH_SECONDS, self.flush_last_used)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush_last_used(self):
+        """Write all queued last_used bumps in one transaction"""
+        with self._db_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if not self._pending_last_used:
+                return
+            
+            pending = self._pending_last_used
+            self._pending_last_used = {}
+            with self._db() as conn:
+                conn.executemany(
+                    'UPDATE sessions SET last_used = ? WHERE id = ?',
+                    [(ts, session_id) for session_id, ts in pending.items()]
+                )
     
     def _init_database(self):
         """Initialize SQLite database"""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db() as conn:
             cursor = conn.cursor()
             
+            # sqlite3 autocommits DDL, so without an explicit transaction a
+            # first launch pays one commit (and fsync) per table
+            cursor.execute('BEGIN')
+            
             # Sessions table
             cursor.execute('''
                 CREATE TABLE IF NOT EXISTS sessions (
@@ -104,18 +217,18 @@ class SessionManager:
             'domain': domain,
             'username': credentials.get('username') if credentials else None,
             'email': credentials.get('email') if credentials else None,
-            'cookies': json.dumps({}),
-            'tokens': json.dumps({}),
-            'headers': json.dumps({}),
-            'login_data': json.dumps(credentials) if credentials else '{}',
+            'cookies': '{}',
+            'tokens': '{}',
+            'headers': '{}',
+            'login_data': _json_text(credentials) if credentials else '{}',
             'created_at': datetime.now().isoformat(),
             'last_used': datetime.now().isoformat(),
             'expires_at': (datetime.now() + timedelta(days=7)).isoformat(),
             'is_active': 1,
-            'metadata': json.dumps({'auto_created': True})
+            'metadata': _json_text({'auto_created': True})
         }
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db() as conn:
             cursor = conn.cursor()
             cursor.execute('''
                 INSERT INTO sessions 
@@ -127,6 +240,9 @@ class SessionManager:
         # Add to cache
         self.active_sessions[session_id] = session_data
         
+        # Let the expiry checker re-plan around the new session
+        self._wake_event.set()
+        
         print(f"🔐 Created new session for {domain}: {session_id}")
         return session_id
     
@@ -145,7 +261,7 @@ class SessionManager:
                 self.active_sessions[session_id]['last_used'] = datetime.now().isoformat()
             
             # Update database
-            with sqlite3.connect(self.db_path) as conn:
+            with self._db() as conn:
                 cursor = conn.cursor()
                 
                 # Build update query
@@ -153,8 +269,8 @@ class SessionManager:
                 values = []
                 
                 for key, value in updates.items():
-                    if key in ['cookies', 'tokens', 'headers', 'login_data', 'metadata']:
-                        value = json.dumps(value) if isinstance(value, (dict, list)) else value
+                    if key in SESSION_JSON_FIELDS:
+                        value = _json_text(value) if isinstance(value, (dict, list)) else value
                     
                     set_clauses.append(f"{key} = ?")
                     values.append(value)
@@ -169,6 +285,9 @@ class SessionManager:
                 cursor.execute(query, values)
                 conn.commit()
             
+            if 'expires_at' in updates or 'is_active' in updates:
+                self._wake_event.set()
+            
             return True
     
     def get_session(self, session_id):
@@ -178,9 +297,9 @@ class SessionManager:
             return self.active_sessions[session_id]
         
         # Query database
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('SELECT * FROM sessions WHERE id = ?', (session_id,))
             row = cursor.fetchone()
@@ -188,12 +307,7 @@ class SessionManager:
             if row:
                 session = dict(row)
                 # Parse JSON fields
-                for field in ['cookies', 'tokens', 'headers', 'login_data', 'metadata']:
-                    if session[field]:
-                        try:
-                            session[field] = json.loads(session[field])
-                        except:
-                            session[field] = {}
+                _parse_json_fields(session, SESSION_JSON_FIELDS)
                 
                 # Add to cache
                 self.active_sessions[session_id] = session
@@ -203,9 +317,9 @@ class SessionManager:
     
     def get_session_for_domain(self, domain, create_if_missing=True):
         """Get active session for a domain"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('''
                 SELECT * FROM sessions 
@@ -219,21 +333,15 @@ class SessionManager:
             if row:
                 session = dict(row)
                 # Parse JSON fields
-                for field in ['cookies', 'tokens', 'headers', 'login_data', 'metadata']:
-                    if session[field]:
-                        try:
-                            session[field] = json.loads(session[field])
-                        except:
-                            session[field] = {}
+                _parse_json_fields(session, SESSION_JSON_FIELDS)
                 
                 # Update cache
                 session_id = session['id']
                 self.active_sessions[session_id] = session
                 
-                # Update last used
-                cursor.execute('UPDATE sessions SET last_used = ? WHERE id = ?', 
-                             (datetime.now().isoformat(), session_id))
-                conn.commit()
+                # Update last used; only this session's timestamp moves
+                # forward, so deferring it cannot change the ORDER BY above
+                self._touch_session(session_id)
                 
                 return session
         
@@ -243,42 +351,52 @@ class SessionManager:
         
         return None
     
-    def add_captured_request(self, session_id, request_data):
-        """Store a captured request"""
+    def _captured_request_row(self, session_id, request_data):
+        """Build the captured_requests row for a request"""
         request_id = hashlib.sha256(
             f"{request_data.get('url')}_{request_data.get('timestamp', '')}".encode()
         ).hexdigest()[:16]
         
-        with sqlite3.connect(self.db_path) as conn:
+        return (
+            request_id,
+            session_id,
+            request_data.get('url'),
+            request_data.get('method'),
+            _json_text(request_data.get('requestHeaders', {})),
+            request_data.get('requestBody', ''),
+            _json_text(request_data.get('responseHeaders', {})),
+            request_data.get('responseBody', ''),
+            request_data.get('statusCode'),
+            request_data.get('timestamp', datetime.now().isoformat())
+        )
+    
+    def add_captured_request(self, session_id, request_data):
+        """Store a captured request"""
+        return self.add_captured_requests_bulk(session_id, [request_data])[0]
+    
+    def add_captured_requests_bulk(self, session_id, requests):
+        """Store several captured requests in one transaction"""
+        rows = [self._captured_request_row(session_id, req) for req in requests]
+        
+        with self._db() as conn:
             cursor = conn.cursor()
             
-            cursor.execute('''
+            cursor.executemany('''
                 INSERT OR REPLACE INTO captured_requests 
                 (id, session_id, url, method, request_headers, request_body, 
                  response_headers, response_body, status_code, timestamp)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                request_id,
-                session_id,
-                request_data.get('url'),
-                request_data.get('method'),
-                json.dumps(request_data.get('requestHeaders', {})),
-                request_data.get('requestBody', ''),
-                json.dumps(request_data.get('responseHeaders', {})),
-                request_data.get('responseBody', ''),
-                request_data.get('statusCode'),
-                request_data.get('timestamp', datetime.now().isoformat())
-            ))
+            ''', rows)
             
             conn.commit()
         
-        return request_id
+        return [row[0] for row in rows]
     
     def get_requests_for_session(self, session_id, limit=100):
         """Get captured requests for a session"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('''
                 SELECT * FROM captured_requests 
@@ -293,12 +411,7 @@ class SessionManager:
             for row in rows:
                 req = dict(row)
                 # Parse JSON fields
-                for field in ['request_headers', 'response_headers']:
-                    if req[field]:
-                        try:
-                            req[field] = json.loads(req[field])
-                        except:
-                            req[field] = {}
+                _parse_json_fields(req, REQUEST_JSON_FIELDS)
                 
                 requests.append(req)
             
@@ -332,7 +445,7 @@ class SessionManager:
         response_body = request_data.get('responseBody', '')
         if response_body:
             try:
-                body_json = json.loads(response_body)
+                body_json = _json_loads(response_body)
                 if isinstance(body_json, dict):
                     for key, value in body_json.items():
                         key_lower = key.lower()
@@ -411,7 +524,6 @@ class SessionManager:
         if captcha_type == 'math' and question:
             # Simple math CAPTCHA
             try:
-                import re
                 # Extract numbers and operation
                 numbers = re.findall(r'\d+', question)
                 if len(numbers) >= 2:
@@ -429,7 +541,6 @@ class SessionManager:
         
         elif captcha_type == 'image' and image_data and auto_solve:
             # Save image for external solving
-            import base64
             try:
                 image_bytes = base64.b64decode(image_data)
                 captcha_dir = os.path.join(self.config_dir, 'captchas')
@@ -460,7 +571,7 @@ class SessionManager:
             }
             
             # Also save to database
-            with sqlite3.connect(self.db_path) as conn:
+            with self._db() as conn:
                 cursor = conn.cursor()
                 captcha_id = hashlib.md5(str(captcha_data).encode()).hexdigest()[:16]
                 
@@ -514,9 +625,9 @@ class SessionManager:
         """Get saved login patterns for a domain"""
         patterns = []
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._db() as conn:
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             
             cursor.execute('''
                 SELECT * FROM captured_requests 
@@ -541,18 +652,24 @@ class SessionManager:
     
     def _auto_refresh_sessions(self):
         """Background thread to refresh expiring sessions"""
+        interval = SESSION_CHECK_MIN_SECONDS
         while True:
-            time.sleep(60)  # Check every minute
+            self._wake_event.wait(interval)
+            self._wake_event.clear()
+            if self._stop_event.is_set():
+                return
             
+            interval = SESSION_CHECK_MIN_SECONDS
             try:
-                with sqlite3.connect(self.db_path) as conn:
+                with self._db() as conn:
                     cursor = conn.cursor()
                     
                     # Find sessions expiring soon
+                    window_end = datetime.now() + timedelta(hours=1)
                     cursor.execute('''
                         SELECT id FROM sessions 
                         WHERE expires_at < ? AND is_active = 1
-                    ''', ((datetime.now() + timedelta(hours=1)).isoformat(),))
+                    ''', (window_end.isoformat(),))
                     
                     expiring = cursor.fetchall()
                     
@@ -560,6 +677,18 @@ class SessionManager:
                         print(f"🔄 Session {session_id} expiring soon")
                         # Attempt refresh (placeholder)
                         # self._refresh_session(session_id)
+                    
+                    if not expiring:
+                        # Sleep until the next session enters the window
+                        cursor.execute(
+                            'SELECT MIN(expires_at) FROM sessions WHERE is_active = 1'
+                        )
+                        next_expiry = cursor.fetchone()[0]
+                        if next_expiry is None:
+                            interval = SESSION_CHECK_MAX_SECONDS
+                        else:
+                            wait = (datetime.fromisoformat(next_expiry) - window_end).total_seconds()
+                            interval = min(max(wait, SESSION_CHECK_MIN_SECONDS), SESSION_CHECK_MAX_SECONDS)
             
             except Exception as e:
                 print(f"⚠️  Session refresh error: {e}")
@@ -573,21 +702,16 @@ class SessionManager:
             'exported_at': datetime.now().isoformat()
         }
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            
+        self.flush_last_used()
+        with self._db() as conn:
             # Export sessions
             cursor = conn.cursor()
+            cursor.row_factory = sqlite3.Row
             cursor.execute('SELECT * FROM sessions')
             for row in cursor.fetchall():
                 session = dict(row)
                 # Parse JSON fields
-                for field in ['cookies', 'tokens', 'headers', 'login_data', 'metadata']:
-                    if session[field]:
-                        try:
-                            session[field] = json.loads(session[field])
-                        except:
-                            session[field] = {}
+                _parse_json_fields(session, SESSION_JSON_FIELDS)
                 
                 export_data['sessions'].append(session)
             
@@ -613,8 +737,6 @@ class SessionManager:
                 json.dump(export_data, f, indent=2)
         elif output_format == 'csv':
             # Simplified CSV export
-            import csv
-            
             # Write sessions
             with open(filepath.replace('.csv', '_sessions.csv'), 'w', newline='') as f:
                 writer = csv.writer(f)
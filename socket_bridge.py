@@ -5,9 +5,14 @@
 # ==============================================================================
 
 import os
+import re
 import sys
+import csv
 import json
+import base64
+import select
 import socket
+import subprocess
 import threading
 import time
 import queue
@@ -170,8 +175,6 @@ class SocketBridge:
     
     def _websocket_handler(self):
         """Handle WebSocket-like connections"""
-        import select
-        
         # Create TCP socket
         ws_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
         ws_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
@@ -532,7 +535,6 @@ class SocketBridge:
             image_data = captcha_data.get('image')
             if image_data:
                 # Save to file
-                import base64
                 try:
                     image_bytes = base64.b64decode(image_data)
                     captcha_file = os.path.join(self.data_dir, f"captcha_{int(time.time())}.png")
@@ -551,7 +553,6 @@ class SocketBridge:
                 # Very simple math evaluation (BE CAREFUL WITH eval!)
                 if 'What is' in question or 'Calculate' in question:
                     # Extract math expression
-                    import re
                     numbers = re.findall(r'\d+', question)
                     if numbers and len(numbers) >= 2:
                         if '+' in question:
@@ -570,13 +571,11 @@ class SocketBridge:
         """Launch a desktop tool"""
         try:
             if tool_name == 'api_tester':
-                import subprocess
                 subprocess.Popen(['python', os.path.join(os.path.dirname(__file__), 'api_tester.py')])
                 self.active_tools['api_tester'] = True
                 return True
             
             elif tool_name == 'sms_panel':
-                import subprocess
                 subprocess.Popen(['python', os.path.join(os.path.dirname(__file__), 'sms_panel.py')])
                 self.active_tools['sms_panel'] = True
                 return True
@@ -622,7 +621,6 @@ class SocketBridge:
                     with open(export_file, 'w') as f:
                         json.dump(requests, f, indent=2)
                 elif format == 'csv':
-                    import csv
                     with open(export_file, 'w', newline='') as f:
                         writer = csv.writer(f)
                         writer.writerow(['URL', 'Method', 'Status', 'Time', 'Size'])
@@ -657,7 +655,6 @@ class SocketBridge:
                     with open(export_file, 'w') as f:
                         json.dump(sms_data, f, indent=2)
                 elif format == 'csv':
-                    import csv
                     with open(export_file, 'w', newline='') as f:
                         writer = csv.writer(f)
                         writer.writerow(['From', 'To', 'Message', 'Time', 'Status'])
@@ -13,6 +13,14 @@ from PyQt5.QtWidgets import *
 from PyQt5.QtCore import *
 from PyQt5.QtGui import *
 
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+# Status bar refresh period; memory and X11 state change on a scale of minutes
+STATUS_REFRESH_MS = 15000
+
 class TurboXDesktop(QMainWindow):
     """Complete TurboX Desktop with Android-style logo"""
     
@@ -265,32 +273,37 @@ class TurboXDesktop(QMainWindow):
         status_bar.addWidget(self.memory_label)
         
         # Update timer
+        self.update_status()
         self.update_timer = QTimer()
         self.update_timer.timeout.connect(self.update_status)
-        self.update_timer.start(2000)
+        self.update_timer.start(STATUS_REFRESH_MS)
     
     def update_status(self):
         """Update status bar information"""
         # Get memory usage
-        try:
-            import psutil
-            memory = psutil.virtual_memory()
-            memory_text = f"🧠 RAM: {memory.percent}% used"
-            self.memory_label.setText(memory_text)
-        except:
-            pass
+        if psutil is not None:
+            try:
+                memory = psutil.virtual_memory()
+                self._set_label_text(self.memory_label, f"🧠 RAM: {memory.percent}% used")
+            except Exception:
+                pass
         
         # Check if X11 is running
         try:
             result = subprocess.run(['pgrep', '-x', 'termux-x11'], 
                                   capture_output=True, text=True)
             if result.returncode == 0:
-                self.status_label.setText("🟢 X11: Running")
+                self._set_label_text(self.status_label, "🟢 X11: Running")
             else:
-                self.status_label.setText("🔴 X11: Not running")
+                self._set_label_text(self.status_label, "🔴 X11: Not running")
         except:
             pass
     
+    def _set_label_text(self, label, text):
+        """Set a label's text only when it differs, avoiding a relayout"""
+        if label.text() != text:
+            label.setText(text)
+    
     def start_background_services(self):
         """Start necessary background services"""
         # Start X11 if not running
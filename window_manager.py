@@ -44,14 +44,17 @@ class WindowManager:
     
     def bring_to_front(self, window):
         """Bring window to front"""
+        # Fires on every pointer entry, so the common case must stay O(1)
+        if window is self.active_window and self.z_order and self.z_order[-1] is window:
+            return
+        
         if window in self.z_order:
             self.z_order.remove(window)
             self.z_order.append(window)
             self.active_window = window
             
-            # Update window stacking
-            for i, win in enumerate(self.z_order):
-                win.raise_() if i == len(self.z_order) - 1 else win.lower()
+            # z_order already holds the stacking, so raising the one window suffices
+            window.raise_()
     
     def remove_window(self, window):
         """Remove window from management"""
@@ -398,15 +401,19 @@ class ResizableWindow(QWidget):
     def update_cursor(self, edges):
         """Update cursor based on resize edges"""
         if not edges:
-            self.setCursor(Qt.ArrowCursor)
+            shape = Qt.ArrowCursor
         elif edges == ['left'] or edges == ['right']:
-            self.setCursor(Qt.SizeHorCursor)
+            shape = Qt.SizeHorCursor
         elif edges == ['top'] or edges == ['bottom']:
-            self.setCursor(Qt.SizeVerCursor)
+            shape = Qt.SizeVerCursor
         elif edges == ['left', 'top'] or edges == ['right', 'bottom']:
-            self.setCursor(Qt.SizeFDiagCursor)
-        elif edges == ['right', 'top'] or edges == ['left', 'bottom']:
-            self.setCursor(Qt.SizeBDiagCursor)
+            shape = Qt.SizeFDiagCursor
+        else:
+            shape = Qt.SizeBDiagCursor
+        
+        # Mouse moves arrive far faster than the shape changes
+        if self.cursor().shape() != shape:
+            self.setCursor(shape)
     
     def update_window_layout(self):
         """Update window layout after resize"""